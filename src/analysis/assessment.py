@@ -8,7 +8,10 @@ back to the video content, driving engagement and credibility.
 
 from __future__ import annotations
 
-from typing import Any
+import functools
+import sys
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 # ─── Theme -> assessment mapping ─────────────────────────────────────
@@ -16,7 +19,7 @@ from typing import Any
 # instructions, what the result reveals, and a call-to-action that
 # ties the test back to video content.
 
-THEME_ASSESSMENTS: dict[str, dict[str, str]] = {
+THEME_ASSESSMENTS: Mapping[str, dict[str, str]] = {
     "sciatica": {
         "assessment_name": "Straight Leg Raise Test",
         "instructions": (
@@ -223,6 +226,13 @@ THEME_ASSESSMENTS: dict[str, dict[str, str]] = {
     },
 }
 
+# Read-only view with interned keys: the mapping is never mutated, so a
+# proxy makes that explicit (and safe to share) while interning turns
+# key comparisons into pointer checks.
+THEME_ASSESSMENTS = MappingProxyType(
+    {sys.intern(key): entry for key, entry in THEME_ASSESSMENTS.items()}
+)
+
 # ─── Default assessment for unrecognized themes ──────────────────────
 
 _DEFAULT_ASSESSMENT: dict[str, str] = {
@@ -253,7 +263,54 @@ def _normalize(text: str) -> str:
     return text.lower().strip()
 
 
-def _token_overlap_score(query_tokens: set[str], key_tokens: set[str]) -> float:
+# Precomputed (key, normalized key, token set) triples so the fuzzy
+# matcher never re-normalizes or re-splits registry keys per call.
+# Built lazily (PEP 562) so importing the package without ever matching
+# a theme skips the work.
+
+_LAZY_INDICES = frozenset({"_ASSESSMENT_INDEX", "_INDEX_BY_KEY_LEN", "_PAYLOADS"})
+
+# Field order of the per-theme payload tuples built by _ensure_index().
+_PAYLOAD_FIELDS = ("assessment_name", "instructions", "what_it_reveals", "cta")
+
+_DEFAULT_PAYLOAD: tuple[str, ...] = tuple(
+    _DEFAULT_ASSESSMENT[field] for field in _PAYLOAD_FIELDS
+)
+
+
+def _ensure_index() -> None:
+    """Build the fuzzy-match index once, on first use."""
+    g = globals()
+    if "_ASSESSMENT_INDEX" in g:
+        return
+
+    index = tuple(
+        (key, _normalize(key), frozenset(map(sys.intern, _normalize(key).split())))
+        for key in THEME_ASSESSMENTS
+    )
+    g["_ASSESSMENT_INDEX"] = index
+    # Containment checks run longest key first so the most specific
+    # theme wins (e.g. "lower back pain" before a future "back pain").
+    g["_INDEX_BY_KEY_LEN"] = tuple(
+        sorted(index, key=lambda entry: len(entry[1]), reverse=True)
+    )
+    # Immutable content payloads per theme: the four assessment strings
+    # never change, so result assembly is a single tuple unpack instead
+    # of four dict lookups per call.
+    g["_PAYLOADS"] = {
+        key: tuple(entry[field] for field in _PAYLOAD_FIELDS)
+        for key, entry in THEME_ASSESSMENTS.items()
+    }
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_INDICES:
+        _ensure_index()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _token_overlap_score(query_tokens: frozenset[str], key_tokens: frozenset[str]) -> float:
     """Compute a simple token-overlap similarity score.
 
     Returns the fraction of key tokens found in the query, giving
@@ -269,12 +326,11 @@ def _token_overlap_score(query_tokens: set[str], key_tokens: set[str]) -> float:
     if not key_tokens:
         return 0.0
 
-    matched = 0.0
-    for kt in key_tokens:
-        # Exact token match
-        if kt in query_tokens:
-            matched += 1.0
-            continue
+    # Exact token matches resolve in a single C-level set intersection;
+    # only the leftover key tokens need the substring sweep.
+    exact = key_tokens & query_tokens
+    matched = float(len(exact))
+    for kt in key_tokens - exact:
         # Substring match: query token contains key token or vice versa
         for qt in query_tokens:
             if kt in qt or qt in kt:
@@ -284,11 +340,14 @@ def _token_overlap_score(query_tokens: set[str], key_tokens: set[str]) -> float:
     return matched / len(key_tokens)
 
 
+@functools.lru_cache(maxsize=2048)
 def _find_best_match(theme: str) -> str | None:
     """Find the best-matching THEME_ASSESSMENTS key for a theme string.
 
     Uses token-overlap scoring to handle partial and fuzzy matches.
     Returns ``None`` if no key scores above a minimum threshold.
+    Results are memoized — the same trend theme is often re-evaluated
+    across pipelines, and the match is pure w.r.t. the input string.
 
     Args:
         theme: The raw theme string to match.
@@ -297,7 +356,10 @@ def _find_best_match(theme: str) -> str | None:
         The best-matching key from ``THEME_ASSESSMENTS``, or ``None``
         if no key meets the similarity threshold (0.4).
     """
-    query_tokens = set(_normalize(theme).split())
+    _ensure_index()
+
+    norm_theme = _normalize(theme)
+    query_tokens = frozenset(norm_theme.split())
     if not query_tokens:
         return None
 
@@ -305,13 +367,13 @@ def _find_best_match(theme: str) -> str | None:
     best_score: float = 0.0
     threshold: float = 0.4
 
-    for key in THEME_ASSESSMENTS:
-        key_tokens = set(_normalize(key).split())
-
-        # Check exact containment first (theme contains the full key)
-        if _normalize(key) in _normalize(theme):
+    # Check exact containment first (theme contains the full key),
+    # longest key first so the most specific match wins.
+    for key, norm_key, _ in _INDEX_BY_KEY_LEN:
+        if norm_key in norm_theme:
             return key
 
+    for key, _, key_tokens in _ASSESSMENT_INDEX:
         score = _token_overlap_score(query_tokens, key_tokens)
         if score > best_score:
             best_score = score
@@ -361,24 +423,20 @@ def suggest_assessment(theme: str) -> dict[str, Any]:
         >>> result["matched_theme"]
         'sciatica'
     """
+    _ensure_index()
     matched_key = _find_best_match(theme)
 
     if matched_key is not None:
-        entry = THEME_ASSESSMENTS[matched_key]
-        return {
-            "assessment_name": entry["assessment_name"],
-            "instructions": entry["instructions"],
-            "what_it_reveals": entry["what_it_reveals"],
-            "cta": entry["cta"],
-            "matched_theme": matched_key,
-            "input_theme": theme,
-        }
+        name, instructions, reveals, cta = _PAYLOADS[matched_key]
+    else:
+        name, instructions, reveals, cta = _DEFAULT_PAYLOAD
+        matched_key = "default"
 
     return {
-        "assessment_name": _DEFAULT_ASSESSMENT["assessment_name"],
-        "instructions": _DEFAULT_ASSESSMENT["instructions"],
-        "what_it_reveals": _DEFAULT_ASSESSMENT["what_it_reveals"],
-        "cta": _DEFAULT_ASSESSMENT["cta"],
-        "matched_theme": "default",
+        "assessment_name": name,
+        "instructions": instructions,
+        "what_it_reveals": reveals,
+        "cta": cta,
+        "matched_theme": matched_key,
         "input_theme": theme,
     }
@@ -13,7 +13,18 @@ high-volume steady topics (1000 -> 1020 = +2%).
 from __future__ import annotations
 
 import math
-from typing import Any
+import sys
+from collections import defaultdict
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
+# NumPy enables single-pass batch scoring; the scalar formula remains
+# the fallback for minimal installs.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -22,7 +33,7 @@ from typing import Any
 # Each group maps to: keywords it absorbs, related wiki articles,
 # subreddit hints, and exercise keys for TOPIC_SOLUTIONS lookup.
 
-BODY_PART_REGISTRY: dict[str, dict[str, Any]] = {
+BODY_PART_REGISTRY: Mapping[str, dict[str, Any]] = {
     "neck": {
         "label": "Neck & Cervical Spine",
         "keywords": [
@@ -200,17 +211,87 @@ BODY_PART_REGISTRY: dict[str, dict[str, Any]] = {
     },
 }
 
-# ── Build reverse lookup: keyword -> group key ─────────────────
-_KEYWORD_TO_GROUP: dict[str, str] = {}
-for _group_key, _group_data in BODY_PART_REGISTRY.items():
-    for _kw in _group_data["keywords"]:
-        _KEYWORD_TO_GROUP[_kw.lower()] = _group_key
+# Read-only view with interned keys — the registry is a constant, and
+# interned group keys make the reverse-lookup values cheap to compare.
+BODY_PART_REGISTRY = MappingProxyType(
+    {sys.intern(key): entry for key, entry in BODY_PART_REGISTRY.items()}
+)
+
+# ── Lazy derived lookups (PEP 562) ─────────────────────────────
+# The reverse lookup and SoA group-id tables are built on first use
+# rather than at import, so entry points that never touch grouping
+# skip the work entirely.
+
+_LAZY_INDICES = frozenset({
+    "_KEYWORD_TO_GROUP", "_KEYWORD_TO_GROUP_GET",
+    "_GROUP_ORDER", "_GROUP_TO_IDX",
+})
+
+
+def _ensure_indices() -> None:
+    """Build the derived lookup structures once, on first use."""
+    g = globals()
+    if "_KEYWORD_TO_GROUP" in g:
+        return
+
+    # keyword -> group key reverse lookup
+    keyword_to_group = {
+        sys.intern(kw.lower()): group_key
+        for group_key, group_data in BODY_PART_REGISTRY.items()
+        for kw in group_data["keywords"]
+    }
+    g["_KEYWORD_TO_GROUP"] = keyword_to_group
+    # Bound-method fast path for hot loops — one attribute resolution
+    # here instead of one per lookup.
+    g["_KEYWORD_TO_GROUP_GET"] = keyword_to_group.get
+
+    # Integer group ids for the SoA aggregation path; "other" is the
+    # trailing bucket for unregistered keywords.
+    group_order = tuple(BODY_PART_REGISTRY) + ("other",)
+    g["_GROUP_ORDER"] = group_order
+    g["_GROUP_TO_IDX"] = {grp: i for i, grp in enumerate(group_order)}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_INDICES:
+        _ensure_indices()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ═══════════════════════════════════════════════════════════════════
 # COMPOSITE SCORING
 # ═══════════════════════════════════════════════════════════════════
 
+# Reciprocal of log(101): multiplying is much cheaper than dividing in
+# the per-keyword hot path.
+_INV_LOG101 = 1.0 / math.log(101)
+
+
+def _composite_core(current: float, wow_pct: float, four_w_avg: float) -> float:
+    """Composite formula on pre-clamped floats, without rounding.
+
+    Kept free of Python objects and ``None`` handling so it can be
+    JIT-compiled when Numba is installed.
+    """
+    vol = math.log1p(current) * _INV_LOG101
+    mom = math.tanh(wow_pct / 100.0)
+    # Shift momentum from [-1, 1] to [0, 1] so declining = 0, neutral = 0.5
+    mom_norm = (mom + 1.0) / 2.0
+    stab = math.log1p(four_w_avg) * _INV_LOG101
+    return 0.45 * vol + 0.35 * mom_norm + 0.20 * stab
+
+
+# JIT the numeric core when Numba is available; `cache=True` persists
+# the compiled code across runs so later processes skip compilation.
+try:
+    from numba import njit
+    _composite_core = njit(
+        "float64(float64, float64, float64)", cache=True, fastmath=True,
+    )(_composite_core)
+except ImportError:
+    pass
+
 
 def compute_composite_score(
     current: float | int,
@@ -240,15 +321,44 @@ def compute_composite_score(
     float
         Composite score, typically in [0, 1].
     """
-    log101 = math.log(101)  # ~4.615
-
-    vol = math.log(max(float(current), 0) + 1) / log101
-    mom = math.tanh((float(wow_pct) if wow_pct is not None else 0.0) / 100.0)
-    # Shift momentum from [-1, 1] to [0, 1] so declining = 0, neutral = 0.5
-    mom_norm = (mom + 1.0) / 2.0
-    stab = math.log(max(float(four_w_avg), 0) + 1) / log101
-
-    return round(0.45 * vol + 0.35 * mom_norm + 0.20 * stab, 4)
+    return round(
+        _composite_core(
+            max(float(current), 0.0),
+            float(wow_pct) if wow_pct is not None else 0.0,
+            max(float(four_w_avg), 0.0),
+        ),
+        4,
+    )
+
+
+def _batch_composite_scores(
+    currents: list[float],
+    wow_pcts: list[float],
+    four_w_avgs: list[float],
+) -> list[float]:
+    """Score many keywords in one pass.
+
+    Vectorizes the :func:`compute_composite_score` formula with NumPy
+    when available (one batched C loop instead of N sets of libm calls
+    through the interpreter); otherwise falls back to the scalar path.
+    ``wow_pcts`` must already have ``None`` replaced with ``0.0``.
+    """
+    if np is None:
+        return [
+            compute_composite_score(c, w, a)
+            for c, w, a in zip(currents, wow_pcts, four_w_avgs)
+        ]
+
+    cur = np.maximum(np.asarray(currents, dtype=np.float64), 0.0)
+    wow = np.asarray(wow_pcts, dtype=np.float64)
+    avg = np.maximum(np.asarray(four_w_avgs, dtype=np.float64), 0.0)
+    composites = np.round(
+        0.45 * _INV_LOG101 * np.log1p(cur)
+        + 0.35 * (np.tanh(wow / 100.0) + 1.0) * 0.5
+        + 0.20 * _INV_LOG101 * np.log1p(avg),
+        4,
+    )
+    return composites.tolist()
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -256,6 +366,29 @@ def compute_composite_score(
 # ═══════════════════════════════════════════════════════════════════
 
 
+# C-implemented sort keys, hoisted so the hot sorts skip per-call
+# lambda frames.
+_BY_COMPOSITE = attrgetter("composite")
+_BY_GROUP_COMPOSITE = itemgetter("group_composite")
+
+
+class _Member(NamedTuple):
+    """Per-keyword scoring record used while grouping.
+
+    A compact NamedTuple keeps attribute access at offset-load cost in
+    the aggregation loops; records become plain dicts only at the public
+    API boundary so snapshots and templates see the same shape as before.
+    """
+
+    keyword: str
+    current: float | int
+    wow_pct: float | None
+    four_w_avg: float | int
+    composite: float
+    prev_week: float | int
+    trend_direction: str
+
+
 def get_body_part_for_keyword(keyword: str) -> str | None:
     """Return the body-part/modality group key for a keyword.
 
@@ -263,7 +396,83 @@ def get_body_part_for_keyword(keyword: str) -> str | None:
 
     Returns ``None`` if the keyword is not in any registered group.
     """
-    return _KEYWORD_TO_GROUP.get(keyword.lower())
+    _ensure_indices()
+    return _KEYWORD_TO_GROUP_GET(keyword.lower())
+
+
+def _group_payload(
+    group_key: str,
+    members: list[dict[str, Any]],
+    group_composite: float,
+) -> dict[str, Any]:
+    """Assemble one output group dict from composite-sorted member dicts."""
+    registry_entry = BODY_PART_REGISTRY.get(group_key)
+    label = registry_entry["label"] if registry_entry else "Other / Ungrouped"
+    lead = members[0]
+
+    return {
+        "group_key": group_key,
+        "label": label,
+        "group_composite": group_composite,
+        "lead_keyword": lead["keyword"],
+        "lead_composite": lead["composite"],
+        "lead_wow_pct": lead["wow_pct"],
+        "lead_current": lead["current"],
+        "member_count": len(members),
+        "members": members,
+    }
+
+
+def _aggregate_numpy(
+    keywords: list[str],
+    rows: list[tuple[Any, Any, Any, Any, str]],
+    composites: list[float],
+) -> list[dict[str, Any]]:
+    """SoA aggregation: one vectorized pass instead of a dict-of-lists.
+
+    A single stable lexsort by (group id, composite descending) lays all
+    keywords out in contiguous group segments already in member order:
+    each segment's max is its first element and per-group sums come from
+    ``np.add.reduceat``.
+    """
+    lookup_group = _KEYWORD_TO_GROUP_GET
+    gids = np.fromiter(
+        (_GROUP_TO_IDX[lookup_group(k.lower()) or "other"] for k in keywords),
+        dtype=np.int64,
+        count=len(keywords),
+    )
+    comp = np.asarray(composites, dtype=np.float64)
+    order = np.lexsort((-comp, gids))
+    sorted_gids = gids[order]
+    sorted_comp = comp[order]
+
+    unique_gids, starts, counts = np.unique(
+        sorted_gids, return_index=True, return_counts=True
+    )
+    sums = np.add.reduceat(sorted_comp, starts)
+
+    groups: list[dict[str, Any]] = []
+    for gid, start, count, seg_sum in zip(unique_gids, starts, counts, sums):
+        members = []
+        for i in order[start:start + count]:
+            current, wow_pct, four_w_avg, prev_week, trend_direction = rows[i]
+            members.append({
+                "keyword": keywords[i],
+                "current": current,
+                "wow_pct": wow_pct,
+                "four_w_avg": four_w_avg,
+                "composite": composites[i],
+                "prev_week": prev_week,
+                "trend_direction": trend_direction,
+            })
+
+        max_score = float(sorted_comp[start])  # segment is composite-desc
+        mean_score = float(seg_sum) / int(count)
+        group_composite = round(max_score * 0.6 + mean_score * 0.4, 4)
+        groups.append(_group_payload(_GROUP_ORDER[gid], members, group_composite))
+
+    groups.sort(key=_BY_GROUP_COMPOSITE, reverse=True)
+    return groups
 
 
 def group_keywords_by_body_part(
@@ -292,67 +501,78 @@ def group_keywords_by_body_part(
     if not google:
         return []
 
-    # Score each keyword and assign to a group
-    group_members: dict[str, list[dict[str, Any]]] = {}
+    _ensure_indices()
 
+    # Parse once into parallel columns so all keywords score in one batch
+    keywords: list[str] = []
+    rows: list[tuple[Any, Any, Any, Any, str]] = []
     for keyword, data in google.items():
         if not isinstance(data, dict):
             continue
-
-        current = data.get("current", 0)
-        wow_pct = data.get("wow_pct")
-        four_w_avg = data.get("4w_avg", 0)
-
-        composite = compute_composite_score(current, wow_pct, four_w_avg)
-        group_key = get_body_part_for_keyword(keyword) or "other"
-
-        member = {
-            "keyword": keyword,
-            "current": current,
-            "wow_pct": wow_pct,
-            "four_w_avg": four_w_avg,
-            "composite": composite,
-            "prev_week": data.get("prev_week", 0),
-            "trend_direction": data.get("4w_trend", "stable"),
-        }
-
-        if group_key not in group_members:
-            group_members[group_key] = []
-        group_members[group_key].append(member)
+        get = data.get  # bound once per record, not once per field
+        keywords.append(keyword)
+        rows.append((
+            get("current", 0),
+            get("wow_pct"),
+            get("4w_avg", 0),
+            get("prev_week", 0),
+            get("4w_trend", "stable"),
+        ))
+
+    composites = _batch_composite_scores(
+        [float(row[0]) for row in rows],
+        [0.0 if row[1] is None else float(row[1]) for row in rows],
+        [float(row[2]) for row in rows],
+    )
+
+    if np is not None and keywords:
+        return _aggregate_numpy(keywords, rows, composites)
+
+    # Assign each scored keyword to a group
+    group_members: dict[str, list[_Member]] = defaultdict(list)
+    lookup_group = _KEYWORD_TO_GROUP_GET  # bind once, outside the loop
+
+    for keyword, row, composite in zip(keywords, rows, composites):
+        current, wow_pct, four_w_avg, prev_week, trend_direction = row
+        group_key = lookup_group(keyword.lower()) or "other"
+
+        group_members[group_key].append(_Member(
+            keyword, current, wow_pct, four_w_avg,
+            composite, prev_week, trend_direction,
+        ))
 
     # Build group-level aggregates
     groups: list[dict[str, Any]] = []
 
     for group_key, members in group_members.items():
-        scores = [m["composite"] for m in members]
-        max_score = max(scores)
-        mean_score = sum(scores) / len(scores)
+        # Single fused pass: running max and sum, no throwaway score list
+        score_sum = 0.0
+        max_score = -1.0
+        for m in members:
+            c = m.composite
+            score_sum += c
+            if c > max_score:
+                max_score = c
+        mean_score = score_sum / len(members)
         group_composite = round(max_score * 0.6 + mean_score * 0.4, 4)
 
         # Sort members within group by composite descending
-        members.sort(key=lambda m: m["composite"], reverse=True)
-        lead = members[0]
-
-        registry_entry = BODY_PART_REGISTRY.get(group_key)
-        label = registry_entry["label"] if registry_entry else "Other / Ungrouped"
-
-        groups.append({
-            "group_key": group_key,
-            "label": label,
-            "group_composite": group_composite,
-            "lead_keyword": lead["keyword"],
-            "lead_composite": lead["composite"],
-            "lead_wow_pct": lead["wow_pct"],
-            "lead_current": lead["current"],
-            "member_count": len(members),
-            "members": members,
-        })
+        members.sort(key=_BY_COMPOSITE, reverse=True)
+
+        groups.append(_group_payload(
+            group_key, [m._asdict() for m in members], group_composite,
+        ))
 
     # Sort groups by group_composite descending
-    groups.sort(key=lambda g: g["group_composite"], reverse=True)
+    groups.sort(key=_BY_GROUP_COMPOSITE, reverse=True)
     return groups
 
 
+# Memoized exercise lists keyed by (group, solutions identity); callers
+# receive copies so cached entries stay pristine.
+_EXERCISES_CACHE: dict[tuple[str, int], list[str]] = {}
+
+
 def get_exercises_for_body_part(
     group_key: str,
     topic_solutions: dict[str, list],
@@ -378,17 +598,22 @@ def get_exercises_for_body_part(
     if not registry_entry:
         return []
 
-    seen: set[str] = set()
-    exercises: list[str] = []
-
-    for key in registry_entry.get("exercise_keys", []):
-        for ex in topic_solutions.get(key, []):
-            name = ex if isinstance(ex, str) else ex.get("name", str(ex))
-            if name not in seen:
-                seen.add(name)
-                exercises.append(name)
-
-    return exercises
+    # TOPIC_SOLUTIONS is stable module config, so identity is a safe
+    # cache key within a run; repeat lookups skip the nested walk.
+    cache_key = (group_key, id(topic_solutions))
+    cached = _EXERCISES_CACHE.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    # dict.fromkeys dedupes in one C-level pass, preserving order
+    exercises = list(dict.fromkeys(
+        ex if isinstance(ex, str) else ex.get("name", str(ex))
+        for key in registry_entry.get("exercise_keys", [])
+        for ex in topic_solutions.get(key, [])
+    ))
+
+    _EXERCISES_CACHE[cache_key] = exercises
+    return list(exercises)
 
 
 def select_theme_from_groups(
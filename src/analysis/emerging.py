@@ -8,7 +8,12 @@ Wikipedia breakouts, and Quora questions.
 
 from __future__ import annotations
 
-from typing import Any
+import functools
+import hashlib
+import heapq
+import string
+from collections import defaultdict
+from typing import Any, Iterable, Iterator
 
 # ─── Stopwords used for Reddit topic fingerprinting ──────────────────
 _STOPWORDS: frozenset[str] = frozenset({
@@ -24,35 +29,100 @@ _STOPWORDS: frozenset[str] = frozenset({
     "cant", "get", "got", "going", "been", "still", "even",
 })
 
+# Version stamp for the persisted fingerprint cache; changing the
+# stopword list or the tokenization scheme must invalidate cached
+# fingerprints, so the stamp hashes both.
+_TOKENIZER_TAG = "punct-fold-v1"
 
+_FP_CACHE_VERSION: str = hashlib.sha1(
+    (_TOKENIZER_TAG + " " + " ".join(sorted(_STOPWORDS))).encode()
+).hexdigest()
+
+
+# Punctuation folds to whitespace during tokenization so "pain," and
+# "pain" produce the same token.
+_PUNCT_TO_SPACE = str.maketrans(dict.fromkeys(string.punctuation, " "))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(text: str) -> str:
+    """Lowercase text and fold punctuation to spaces, one C pass each."""
+    return text.lower().translate(_PUNCT_TO_SPACE)
+
+
+@functools.lru_cache(maxsize=4096)
 def _fingerprint(text: str) -> frozenset[str]:
     """Create a topic fingerprint from text.
 
-    Lowercases, splits on whitespace, and removes common stopwords.
-    Returns the remaining significant words as a frozenset.
+    Lowercases, folds punctuation to whitespace, splits, and removes
+    common stopwords. Returns the remaining significant words as a
+    frozenset. Memoized, since the same titles are fingerprinted by
+    several passes; the stopword filter is a single C-level set
+    difference rather than a per-word membership loop.
     """
-    words = text.lower().split()
-    return frozenset(w for w in words if w not in _STOPWORDS)
+    return frozenset(_normalize(text).split()).difference(_STOPWORDS)
 
 
-def _best_overlap(fingerprint: frozenset[str], prior_fingerprints: set[frozenset[str]]) -> float:
-    """Compute the highest Jaccard-like overlap between a fingerprint and a set of prior fingerprints.
+def _build_word_index(fingerprints: list[frozenset[str]]) -> dict[str, list[int]]:
+    """Map each word to the indices of the fingerprints containing it.
 
-    Returns a float in [0.0, 1.0] representing the fraction of the current
-    fingerprint's words found in the closest prior fingerprint.
+    Lets the novelty check compare a current post only against priors
+    sharing at least one word — every other prior has zero overlap by
+    definition, so the quadratic all-pairs scan collapses to the few
+    genuine candidates.
+    """
+    index: dict[str, list[int]] = defaultdict(list)
+    for i, fp in enumerate(fingerprints):
+        for word in fp:
+            index[word].append(i)
+    return index
+
+
+def _pack_mask(fingerprint: frozenset[str], vocab: dict[str, int]) -> int:
+    """Pack a fingerprint into an int bitmask, growing ``vocab`` as needed.
+
+    Each distinct word gets a bit position; word-set intersections then
+    become a single bitwise AND over machine words.
+    """
+    mask = 0
+    for word in fingerprint:
+        bit = vocab.setdefault(word, len(vocab))
+        mask |= 1 << bit
+    return mask
+
+
+def _best_overlap(
+    cur_mask: int,
+    cur_size: int,
+    prior_masks: list[int],
+    candidate_ids: Iterable[int],
+) -> float:
+    """Highest overlap ratio between a packed fingerprint and prior masks.
+
+    Returns a float in [0.0, 1.0] representing the fraction of the
+    current fingerprint's words found in the closest prior fingerprint.
+    Per-word set hashing is replaced by one AND plus one C-level
+    popcount (``int.bit_count``) per candidate; the inner loop compares
+    raw popcounts, divides once at the end, and stops early once a
+    prior covers the whole fingerprint — no better match exists.
     """
-    if not fingerprint or not prior_fingerprints:
-        return 0.0
+    best = 0
+    for i in candidate_ids:
+        count = (cur_mask & prior_masks[i]).bit_count()
+        if count > best:
+            best = count
+            if best == cur_size:
+                break
+    return best / cur_size
 
-    best = 0.0
-    for prior_fp in prior_fingerprints:
-        overlap_count = len(fingerprint & prior_fp)
-        total = len(fingerprint)
-        if total > 0:
-            ratio = overlap_count / total
-            if ratio > best:
-                best = ratio
-    return best
+
+def _canon_url(url: str) -> str:
+    """Canonicalize a URL for cross-week matching.
+
+    Strips trailing slashes and lowercases, so minor drift in how a
+    post URL is reported week to week doesn't break dedup.
+    """
+    return url.rstrip("/").lower() if url else ""
 
 
 def _all_prior_words(prior_fingerprints: set[frozenset[str]]) -> frozenset[str]:
@@ -87,18 +157,25 @@ def _google_score_for_keyword(
     return int(google[keyword].get("current", 0))
 
 
-def _find_parent_keyword(
-    query: str,
+def _build_parent_index(
     rising_queries: dict[str, dict[str, list[dict[str, Any]]]] | None,
-) -> str | None:
-    """Find which parent keyword a rising query belongs to."""
+) -> dict[str, str]:
+    """Map each rising query string to its parent keyword.
+
+    Built once per diff so the per-query lookup is O(1) instead of
+    re-walking the whole rising_queries structure. ``setdefault`` keeps
+    first-keyword-wins semantics for queries listed under several
+    keywords.
+    """
+    parent_of: dict[str, str] = {}
     if not rising_queries:
-        return None
+        return parent_of
     for keyword, keyword_data in rising_queries.items():
         for entry in keyword_data.get("rising", []):
-            if entry.get("query", "") == query:
-                return keyword
-    return None
+            query = entry.get("query", "")
+            if query:
+                parent_of.setdefault(query, keyword)
+    return parent_of
 
 
 def _extract_reddit_posts(reddit: dict | None) -> list[dict[str, Any]]:
@@ -118,26 +195,83 @@ def _extract_reddit_posts(reddit: dict | None) -> list[dict[str, Any]]:
     return posts
 
 
-def _extract_quora_fingerprints(quora: list[dict[str, Any]] | None) -> dict[str, dict[str, Any]]:
-    """Build a mapping of fingerprint-string -> quora item for deduplication."""
-    result: dict[str, dict[str, Any]] = {}
+def _iter_post_titles(reddit: dict | None) -> Iterator[str]:
+    """Yield Reddit post titles without copying post dicts.
+
+    The fingerprint passes only need titles, so this skips the
+    per-post enrichment copies ``_extract_reddit_posts`` makes and
+    keeps peak memory flat on large prior snapshots.
+    """
+    if not reddit:
+        return
+    for subreddit_posts in reddit.values():
+        if not isinstance(subreddit_posts, list):
+            continue
+        for post in subreddit_posts:
+            if isinstance(post, dict):
+                yield post.get("title", "")
+
+
+def _extract_quora_fingerprints(
+    quora: list[dict[str, Any]] | None,
+) -> dict[frozenset[str], dict[str, Any]]:
+    """Build a mapping of fingerprint -> quora item for deduplication.
+
+    The frozenset fingerprints are used as dict keys directly; sorting
+    them per question is deferred to the few items actually reported
+    as new.
+    """
+    result: dict[frozenset[str], dict[str, Any]] = {}
     if not quora:
         return result
     for item in quora:
         question = item.get("question", "")
-        fp = str(sorted(_fingerprint(question)))
-        result[fp] = item
+        result[_fingerprint(question)] = item
     return result
 
 
+def _extract_quora_fingerprint_keys(
+    quora: list[dict[str, Any]] | None,
+) -> set[frozenset[str]]:
+    """Collect just the fingerprint keys — all the diff needs for priors."""
+    if not quora:
+        return set()
+    return {_fingerprint(item.get("question", "")) for item in quora}
+
+
 # ═════════════════════════════════════════════════════════════════════
 # PUBLIC API
 # ═════════════════════════════════════════════════════════════════════
 
 
+def build_prior_fingerprint_cache(
+    reddit: dict[str, list[dict[str, Any]]] | None,
+    date: str | None,
+) -> dict[str, Any]:
+    """Pre-tokenize this week's Reddit titles for next week's diff.
+
+    Saved alongside the weekly snapshot so ``detect_emerging_signals``
+    can skip re-fingerprinting thousands of prior titles. The version
+    stamp ties the cache to the stopword list; the date ties it to its
+    snapshot.
+    """
+    fingerprints: set[frozenset[str]] = set()
+    for title in _iter_post_titles(reddit):
+        fp = _fingerprint(title)
+        if fp:
+            fingerprints.add(fp)
+    return {
+        "version": _FP_CACHE_VERSION,
+        "date": date,
+        "fingerprints": list(fingerprints),
+        "all_words": _all_prior_words(fingerprints),
+    }
+
+
 def detect_emerging_signals(
     current: dict[str, Any],
     prior: dict[str, Any] | None,
+    prior_fingerprint_cache: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Compare current week's data against a prior snapshot to find new signals.
 
@@ -145,6 +279,9 @@ def detect_emerging_signals(
         current: Dict with keys ``google``, ``rising_queries``, ``reddit``,
             ``quora``, ``wikipedia``.
         prior: Same structure from the prior snapshot, or ``None`` on first run.
+        prior_fingerprint_cache: Optional pre-tokenized Reddit
+            fingerprints from ``build_prior_fingerprint_cache``, used
+            only when its version and date match the prior snapshot.
 
     Returns:
         A dict containing ``new_rising_queries``, ``new_reddit_topics``,
@@ -170,9 +307,10 @@ def detect_emerging_signals(
         cur_query_set = _extract_rising_query_set(cur_rising)
         pri_query_set = _extract_rising_query_set(pri_rising)
         new_queries = cur_query_set - pri_query_set
+        parent_of = _build_parent_index(cur_rising)
 
         for query in new_queries:
-            parent = _find_parent_keyword(query, cur_rising)
+            parent = parent_of.get(query)
             parent_score = _google_score_for_keyword(cur_google, parent) if parent else 0
             new_rising_queries.append({
                 "query": query,
@@ -187,13 +325,13 @@ def detect_emerging_signals(
     cur_posts = _extract_reddit_posts(cur_reddit)
 
     if is_first_run:
-        # First run: return top 5 by score, don't flag everything
-        sorted_posts = sorted(
-            cur_posts,
-            key=lambda p: int(p.get("score", 0)),
-            reverse=True,
+        # First run: return top 5 by score, don't flag everything.
+        # nlargest keeps the selection O(N log 5) and matches
+        # sorted(..., reverse=True)[:5] exactly, ties included.
+        top_posts = heapq.nlargest(
+            5, cur_posts, key=lambda p: int(p.get("score", 0)),
         )
-        for post in sorted_posts[:5]:
+        for post in top_posts:
             fp = _fingerprint(post.get("title", ""))
             new_reddit_topics.append({
                 "title": post.get("title", ""),
@@ -203,20 +341,40 @@ def detect_emerging_signals(
                 "novel_terms": sorted(fp),
             })
     else:
-        pri_posts = _extract_reddit_posts(pri_reddit)
-        prior_fingerprints: set[frozenset[str]] = set()
-        for post in pri_posts:
-            fp = _fingerprint(post.get("title", ""))
-            if fp:
-                prior_fingerprints.add(fp)
-
-        all_prior = _all_prior_words(prior_fingerprints)
+        cache = prior_fingerprint_cache
+        if (
+            cache is not None
+            and cache.get("version") == _FP_CACHE_VERSION
+            and cache.get("date") == (prior or {}).get("date")
+        ):
+            prior_list: list[frozenset[str]] = list(cache["fingerprints"])
+            all_prior = cache["all_words"]
+        else:
+            prior_fingerprints: set[frozenset[str]] = set()
+            for title in _iter_post_titles(pri_reddit):
+                fp = _fingerprint(title)
+                if fp:
+                    prior_fingerprints.add(fp)
+
+            all_prior = _all_prior_words(prior_fingerprints)
+            prior_list = list(prior_fingerprints)
+
+        # Word -> prior-fingerprint index for candidate pruning, plus
+        # packed bitmasks sharing one vocabulary for cheap intersections
+        word_index = _build_word_index(prior_list)
+        vocab: dict[str, int] = {}
+        prior_masks = [_pack_mask(p, vocab) for p in prior_list]
 
         for post in cur_posts:
             fp = _fingerprint(post.get("title", ""))
             if not fp:
                 continue
-            overlap = _best_overlap(fp, prior_fingerprints)
+            candidate_ids: set[int] = set()
+            for word in fp:
+                candidate_ids.update(word_index.get(word, ()))
+            overlap = _best_overlap(
+                _pack_mask(fp, vocab), len(fp), prior_masks, candidate_ids,
+            ) if candidate_ids else 0.0
             if overlap < 0.50:
                 novel = sorted(fp - all_prior)
                 new_reddit_topics.append({
@@ -256,15 +414,15 @@ def detect_emerging_signals(
     new_quora_questions: list[dict[str, Any]] = []
     if not is_first_run:
         cur_quora_fps = _extract_quora_fingerprints(cur_quora)
-        pri_quora_fps = _extract_quora_fingerprints(pri_quora)
+        pri_quora_keys = _extract_quora_fingerprint_keys(pri_quora)
 
-        new_fp_keys = set(cur_quora_fps.keys()) - set(pri_quora_fps.keys())
-        for fp_key in new_fp_keys:
-            item = cur_quora_fps[fp_key]
+        for fp, item in cur_quora_fps.items():
+            if fp in pri_quora_keys:
+                continue
             new_quora_questions.append({
                 "question": item.get("question", ""),
                 "url": item.get("url", ""),
-                "fingerprint": fp_key,
+                "fingerprint": sorted(fp),
             })
 
     # ── Summary ─────────────────────────────────────────────────────
@@ -310,17 +468,15 @@ def deduplicate_reddit_posts(
     if not current_posts:
         return {}
 
-    # Build a lookup from URL -> post dict for prior data
-    prior_by_url: dict[str, dict[str, Any]] = {}
-    if prior_posts:
-        for subreddit_posts in prior_posts.values():
-            if not isinstance(subreddit_posts, list):
-                continue
-            for post in subreddit_posts:
-                if isinstance(post, dict):
-                    url = post.get("url", post.get("permalink", ""))
-                    if url:
-                        prior_by_url[url] = post
+    # Build a lookup from canonical URL -> post dict for prior data
+    prior_by_url: dict[str, dict[str, Any]] = {
+        _canon_url(post.get("url", post.get("permalink", ""))): post
+        for subreddit_posts in (prior_posts or {}).values()
+        if isinstance(subreddit_posts, list)
+        for post in subreddit_posts
+        if isinstance(post, dict)
+        and post.get("url", post.get("permalink", ""))
+    }
 
     result: dict[str, list[dict[str, Any]]] = {}
 
@@ -337,7 +493,7 @@ def deduplicate_reddit_posts(
 
             enriched = dict(post)
             url = post.get("url", post.get("permalink", ""))
-            prior_match = prior_by_url.get(url) if url else None
+            prior_match = prior_by_url.get(_canon_url(url)) if url else None
 
             if prior_match is None:
                 enriched["is_new"] = True
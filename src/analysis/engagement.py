@@ -7,9 +7,18 @@ they are for a helpful reply from Bart (the FormCoach persona).
 
 from __future__ import annotations
 
+import heapq
 import math
+import re
 from typing import Any
 
+from .emerging import _normalize
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ─── Help-seeking keywords (multi-word phrases checked as substrings) ─
 _HELP_SIGNALS: list[str] = [
     "advice", "help", "struggling", "years", "months",
@@ -19,6 +28,24 @@ _HELP_SIGNALS: list[str] = [
     "scared", "terrified", "frustrated",
 ]
 
+# Single-word signals are matched as whole tokens with one set
+# intersection; only the multi-word phrases still need a substring
+# scan. The lookahead keeps that scan zero-width so overlapping
+# phrases are all reported; no phrase is a prefix of another, so one
+# capture per position is exact. Phrases are matched in normalized
+# form ("can't sleep" -> "can t sleep") since candidate text is
+# normalized before scanning, and mapped back to their original
+# spelling for the report.
+_HELP_WORDS: frozenset[str] = frozenset(s for s in _HELP_SIGNALS if " " not in s)
+_NORMALIZED_PHRASES: dict[str, str] = {
+    _normalize(s): s for s in _HELP_SIGNALS if " " in s
+}
+_HELP_PHRASES_RE = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_NORMALIZED_PHRASES, key=len, reverse=True)))
+    + "))"
+)
+
 # ─── Pain/posture relevance keywords ────────────────────────────────
 _RELEVANCE_KEYWORDS: frozenset[str] = frozenset({
     "pain", "back", "neck", "posture", "sciatica", "hip", "shoulder",
@@ -39,44 +66,68 @@ _RELEVANCE_KEYWORDS: frozenset[str] = frozenset({
     "pelvic", "thoracic", "cervical", "lumbar",
 })
 
+# Each relevance keyword owns a bit; a candidate's matches accumulate
+# as one OR per token and a final popcount, so repeated keywords count
+# once instead of letting a stuffed title inflate its relevance.
+_RELEVANCE_BITS: dict[str, int] = {
+    kw: 1 << i for i, kw in enumerate(sorted(_RELEVANCE_KEYWORDS))
+}
+
 
-def _find_help_signals(text: str) -> list[str]:
-    """Find which help-seeking keywords appear in the given text.
+def _scan_candidate_text(norm_text: str) -> tuple[list[str], float, float]:
+    """Extract all text features of a candidate in one token walk.
 
-    Both single-word and multi-word phrases are matched as substrings
-    against the lowercased text.
+    A single loop classifies each token as a help signal and/or a
+    relevance keyword; multi-word help phrases come from the compiled
+    single-pass scan. Fusing the walks means the text is tokenized and
+    traversed once per candidate instead of once per feature.
 
     Args:
-        text: The text to scan (typically title + snippet).
+        norm_text: Pre-normalized text to scan (typically title + snippet).
 
     Returns:
-        A list of matched help-signal strings.
+        A ``(help_signals, density, relevance)`` tuple: the matched
+        help-signal strings, their density over the word count, and
+        the distinct pain/posture keywords hit as a fraction of the
+        word count — the latter two capped at 1.0.
     """
-    lower = text.lower()
-    return [signal for signal in _HELP_SIGNALS if signal in lower]
+    words = norm_text.split()
+    rel_mask = 0
+    found: set[str] = set()
+    rel_bits = _RELEVANCE_BITS.get
+    for w in words:
+        rel_mask |= rel_bits(w, 0)
+        if w in _HELP_WORDS:
+            found.add(w)
+    relevance_hits = rel_mask.bit_count()
+    found.update(_NORMALIZED_PHRASES[m] for m in _HELP_PHRASES_RE.findall(norm_text))
+    help_signals = [signal for signal in _HELP_SIGNALS if signal in found]
 
+    if not words:
+        return help_signals, 0.0, 0.0
+    total = len(words)
+    return (
+        help_signals,
+        min(len(help_signals) / total, 1.0),
+        min(relevance_hits / total, 1.0),
+    )
 
-def _help_signal_density(text: str, help_signals: list[str]) -> float:
-    """Calculate the density of help signals relative to total word count.
 
-    Args:
-        text: Original text.
-        help_signals: Already-matched help signal strings.
-
-    Returns:
-        A float in [0.0, 1.0] representing signal count / total words.
-        Capped at 1.0.
-    """
-    total_words = len(text.split())
-    if total_words == 0:
-        return 0.0
-    return min(len(help_signals) / total_words, 1.0)
+# min(log(c + 1) / 6, 1.0) saturates at 1.0 once c + 1 >= e**6
+# (c >= 403), so a 404-entry table holds every distinct value and
+# comment counts index straight into it instead of calling libm.
+# Counts cluster heavily at 0/1/2, making the duplication free.
+_LOG_LUT: tuple[float, ...] = tuple(
+    min(math.log(c + 1) / 6.0, 1.0) for c in range(404)
+)
+_LOG_LUT_NP = None if np is None else np.asarray(_LOG_LUT)
 
 
 def _comment_engagement(comments: int) -> float:
     """Normalize comment count into a 0-1 score using a log scale.
 
-    Formula: ``log(comments + 1) / 6``, capped at 1.0.
+    Formula: ``log(comments + 1) / 6``, capped at 1.0. Looked up from
+    a precomputed table for in-range counts.
 
     Args:
         comments: Number of comments on the post.
@@ -84,32 +135,18 @@ def _comment_engagement(comments: int) -> float:
     Returns:
         A float in [0.0, 1.0].
     """
+    if 0 <= comments < len(_LOG_LUT):
+        return _LOG_LUT[comments]
     return min(math.log(comments + 1) / 6.0, 1.0)
 
 
-def _relevance_score(title: str) -> float:
-    """Calculate relevance as the fraction of title words that are pain/posture keywords.
-
-    Args:
-        title: The post or question title.
-
-    Returns:
-        A float in [0.0, 1.0].
-    """
-    words = title.lower().split()
-    if not words:
-        return 0.0
-    matches = sum(1 for w in words if w in _RELEVANCE_KEYWORDS)
-    return min(matches / len(words), 1.0)
-
-
-def _compute_engagement_score(
-    text: str,
-    comments: int,
-    is_new: bool,
-    help_signals: list[str],
-) -> float:
-    """Compute the composite engagement score for a single post.
+def _batch_engagement_scores(
+    densities: list[float],
+    comments: list[int],
+    new_flags: list[bool],
+    relevances: list[float],
+) -> list[float]:
+    """Compute composite engagement scores for all candidates at once.
 
     Weights:
         - 0.30 help_signal_density
@@ -118,29 +155,57 @@ def _compute_engagement_score(
         - 0.15 relevance_score (title word overlap)
         - 0.10 recency_score (constant 1.0 for V1)
 
+    The text-derived columns are computed per candidate upstream; this
+    takes them struct-of-arrays style. With NumPy installed the log
+    normalization and the weighted sum run as one C-level call per
+    column; the scalar fallback applies the same formula per row.
+
     Args:
-        text: Combined title + snippet text for signal detection.
-        comments: Number of comments.
-        is_new: Whether this post is newly detected.
-        help_signals: Pre-computed list of matched help signals.
+        densities: Help-signal density per candidate.
+        comments: Comment count per candidate.
+        new_flags: Whether each candidate is newly detected.
+        relevances: Relevance score per candidate.
 
     Returns:
-        A float score, typically in [0.0, 1.0].
+        A list of float scores, typically in [0.0, 1.0].
     """
-    density = _help_signal_density(text, help_signals)
-    comment_eng = _comment_engagement(comments)
-    new_bonus = 1.0 if is_new else 0.3
-    relevance = _relevance_score(text)
     recency = 1.0  # constant for V1 (all posts from last week)
 
-    return round(
-        0.30 * density
-        + 0.25 * comment_eng
-        + 0.20 * new_bonus
-        + 0.15 * relevance
-        + 0.10 * recency,
-        4,
-    )
+    if np is not None and densities:
+        n = len(densities)
+        # One gather through the saturated log table; counts past the
+        # table's end clip to its last entry, which is already 1.0
+        comment_eng = _LOG_LUT_NP[
+            np.clip(
+                np.fromiter(comments, dtype=np.int64, count=n),
+                0,
+                len(_LOG_LUT) - 1,
+            )
+        ]
+        new_bonus = np.where(
+            np.fromiter(new_flags, dtype=bool, count=n), 1.0, 0.3,
+        )
+        scores = (
+            0.30 * np.asarray(densities)
+            + 0.25 * comment_eng
+            + 0.20 * new_bonus
+            + 0.15 * np.asarray(relevances)
+            + 0.10 * recency
+        )
+        return [round(s, 4) for s in scores.tolist()]
+
+    return [
+        round(
+            0.30 * density
+            + 0.25 * _comment_engagement(cmt)
+            + 0.20 * (1.0 if is_new else 0.3)
+            + 0.15 * relevance
+            + 0.10 * recency,
+            4,
+        )
+        for density, cmt, is_new, relevance
+        in zip(densities, comments, new_flags, relevances)
+    ]
 
 
 def _reddit_posts_to_candidates(reddit: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
@@ -225,17 +290,27 @@ def rank_engagement_opportunities(
     if not candidates:
         return []
 
-    # Score each candidate
-    scored: list[dict[str, Any]] = []
+    # Per-candidate text columns: one normalize + one fused token walk
+    # extracts signals, density, and relevance together
+    densities: list[float] = []
+    relevances: list[float] = []
+    signal_lists: list[list[str]] = []
     for cand in candidates:
-        text = f"{cand['title']} {cand['snippet']}"
-        help_signals = _find_help_signals(text)
-        eng_score = _compute_engagement_score(
-            text=text,
-            comments=cand["comments"],
-            is_new=cand["is_new"],
-            help_signals=help_signals,
-        )
+        norm_text = _normalize(f"{cand['title']} {cand['snippet']}")
+        help_signals, density, relevance = _scan_candidate_text(norm_text)
+        signal_lists.append(help_signals)
+        densities.append(density)
+        relevances.append(relevance)
+
+    eng_scores = _batch_engagement_scores(
+        densities,
+        [cand["comments"] for cand in candidates],
+        [cand["is_new"] for cand in candidates],
+        relevances,
+    )
+
+    scored: list[dict[str, Any]] = []
+    for cand, help_signals, eng_score in zip(candidates, signal_lists, eng_scores):
         scored.append({
             "platform": cand["platform"],
             "title": cand["title"],
@@ -249,12 +324,15 @@ def rank_engagement_opportunities(
             "engagement_score": eng_score,
         })
 
-    # Sort by engagement score descending, then by post score as tiebreaker
-    scored.sort(key=lambda x: (x["engagement_score"], x["score"]), reverse=True)
+    # Top N by engagement score descending, post score as tiebreaker;
+    # nlargest matches the old full sort + slice exactly, ties included
+    top = heapq.nlargest(
+        top_n, scored, key=lambda x: (x["engagement_score"], x["score"]),
+    )
 
-    # Take top N and assign ranks
+    # Assign ranks
     results: list[dict[str, Any]] = []
-    for i, item in enumerate(scored[:top_n]):
+    for i, item in enumerate(top):
         item["rank"] = i + 1
         results.append(item)
 
@@ -7,11 +7,15 @@ are product launches, coding tools, or unrelated tech discussions.
 """
 
 from __future__ import annotations
+
+import functools
 from typing import Any
 
+from .keyword_index import build_scanners
+
 
 # Keywords that indicate a story IS relevant to Bart's audience
-_POSITIVE_KEYWORDS = {
+_POSITIVE_KEYWORDS: frozenset[str] = frozenset({
     # Pain & conditions
     "pain", "ache", "injury", "chronic", "inflammation",
     "sciatica", "tendonitis", "tendinitis", "carpal tunnel",
@@ -35,10 +39,10 @@ _POSITIVE_KEYWORDS = {
     "remote work health", "wfh health", "programmer health",
     "developer health", "tech worker health",
     "eye strain", "screen time",
-}
+})
 
 # Keywords that indicate a story is NOT relevant (tech noise)
-_NEGATIVE_KEYWORDS = {
+_NEGATIVE_KEYWORDS: frozenset[str] = frozenset({
     # Dev tools / products
     "show hn", "launch hn", "hiring", "who is hiring",
     "ycombinator", "y combinator", "demo day",
@@ -59,39 +63,44 @@ _NEGATIVE_KEYWORDS = {
     # Entertainment / off-topic
     "game", "gaming", "movie", "book review", "podcast",
     "political", "election", "lawsuit", "antitrust",
-}
+})
 
 # Short terms that need word-boundary matching to avoid false positives
-_BOUNDARY_TERMS = {"rsi", "wfh", "pt"}
+_BOUNDARY_TERMS = frozenset({"rsi", "wfh", "pt"})
 
+# Precompiled single-pass scanners so each title is walked once instead
+# of once per keyword. See keyword_index for how the four scanners
+# divide the work; "ergonomic" / "ergonomics" style overlaps are
+# recovered through _PREFIX_IMPLIED.
+_NEGATIVE_RE, _POSITIVE_RE, _POSITIVE_SHORT, _PREFIX_IMPLIED = build_scanners(
+    _POSITIVE_KEYWORDS, _NEGATIVE_KEYWORDS
+)
 
+
+@functools.lru_cache(maxsize=8192)
 def score_hn_relevance(title: str) -> float:
     """Score a HackerNews story title for health/ergonomics relevance.
 
     Returns a score from 0.0 to 1.0.
     HN has no subreddit-tier boost — all scoring is keyword-based.
+    Memoized, since the same titles recur across feeds and snapshots
+    within a run.
     """
     title_lower = title.lower()
-    words = set(title_lower.split())
 
     # Check negative keywords first — strong disqualifier
-    for neg in _NEGATIVE_KEYWORDS:
-        if neg in title_lower:
-            return 0.0
-
-    # Keyword match scoring
-    strong_matches = 0
-    weak_matches = 0
-
-    for kw in _POSITIVE_KEYWORDS:
-        if len(kw) <= 4:
-            # Short keywords: require word boundary
-            if kw in words or kw in _BOUNDARY_TERMS:
-                if kw in words:
-                    weak_matches += 1
-        else:
-            if kw in title_lower:
-                strong_matches += 1
+    if _NEGATIVE_RE.search(title_lower):
+        return 0.0
+
+    # Keyword match scoring: one scan for long keywords, word-boundary
+    # set lookups for short ones
+    found = set(_POSITIVE_RE.findall(title_lower))
+    for kw in tuple(found):
+        found |= _PREFIX_IMPLIED[kw]
+    strong_matches = len(found)
+
+    words = set(title_lower.split())
+    weak_matches = sum(1 for kw in _POSITIVE_SHORT if kw in words)
 
     # HN stories start from 0.0 base (no sub-tier boost)
     # Need at least one strong match to be considered relevant
@@ -0,0 +1,56 @@
+"""Shared keyword-scanner construction for the relevance filters.
+
+The Reddit and HackerNews filters precompile the same scanner shapes
+from their keyword sets: a longest-first negative alternation, a
+zero-width lookahead over the long positive keywords, a frozenset of
+short word-boundary keywords, and the prefix-containment map that keeps
+per-keyword counts exact when one keyword prefixes another. Building
+all four lives here so the two filters cannot drift apart.
+"""
+
+from __future__ import annotations
+
+import re
+
+
+def build_scanners(
+    positive: frozenset[str],
+    negative: frozenset[str],
+    *,
+    long_threshold: int = 4,
+) -> tuple[re.Pattern[str], re.Pattern[str], frozenset[str], dict[str, frozenset[str]]]:
+    """Compile the single-pass scanners for one keyword universe.
+
+    Args:
+        positive: Keywords that make a title relevant. Those longer than
+            ``long_threshold`` are substring-matched by the lookahead
+            scanner; the rest need word-boundary matching by the caller.
+        negative: Disqualifying keywords, matched as substrings.
+        long_threshold: Length cutoff between substring-matched and
+            word-boundary-matched positive keywords.
+
+    Returns:
+        A ``(negative_re, positive_long_re, positive_short, prefix_implied)``
+        tuple. ``negative_re`` answers the boolean disqualifier check in
+        one scan. ``positive_long_re`` is a zero-width lookahead whose
+        longest-first alternation reports one keyword per position;
+        ``prefix_implied`` maps each long keyword to the shorter long
+        keywords it starts with, so callers can recover matches the
+        alternation shadowed. ``positive_short`` holds the keywords that
+        need word-boundary matching.
+    """
+    negative_re = re.compile(
+        "|".join(map(re.escape, sorted(negative, key=len, reverse=True)))
+    )
+    long_kw = sorted(
+        (kw for kw in positive if len(kw) > long_threshold), key=len, reverse=True
+    )
+    positive_short = frozenset(kw for kw in positive if len(kw) <= long_threshold)
+    positive_long_re = re.compile(
+        "(?=(" + "|".join(map(re.escape, long_kw)) + "))"
+    )
+    prefix_implied = {
+        kw: frozenset(o for o in long_kw if o != kw and kw.startswith(o))
+        for kw in long_kw
+    }
+    return negative_re, positive_long_re, positive_short, prefix_implied
@@ -6,11 +6,19 @@ and drops posts below threshold. This prevents irrelevant posts
 """
 
 from __future__ import annotations
+
+import functools
+import heapq
+import logging
 from typing import Any
 
+from .keyword_index import build_scanners
+
+log = logging.getLogger(__name__)
+
 
 # Keywords that indicate a post IS relevant to pain management / fitness coaching
-_POSITIVE_KEYWORDS = {
+_POSITIVE_KEYWORDS: frozenset[str] = frozenset({
     # Pain & conditions
     "pain", "ache", "sore", "stiff", "tight", "numb", "tingling",
     "inflammation", "flare", "chronic", "acute", "injury", "injured",
@@ -61,10 +69,10 @@ _POSITIVE_KEYWORDS = {
 
     # Longevity
     "longevity", "aging", "functional", "mobility drill",
-}
+})
 
 # Keywords that indicate a post is NOT relevant (strong negative signal)
-_NEGATIVE_KEYWORDS = {
+_NEGATIVE_KEYWORDS: frozenset[str] = frozenset({
     "meme", "shitpost", "rant wednesday", "gym story saturday",
     "victory sunday", "daily thread", "weekly thread",
     "selfie", "progress pic", "physique", "dating", "nsfw", "political",
@@ -74,63 +82,84 @@ _NEGATIVE_KEYWORDS = {
     "what should i eat", "calorie count", "bulk or cut",
     "favorite golf course", "handicap", "putting",
     "what bike should", "new bike day", "strava",
-}
+})
+
+# Single-pass scanners, compiled once: titles used to be rescanned once
+# per keyword (~180 substring searches each). See keyword_index for how
+# the four scanners divide the work; "mobility" / "mobility drill" style
+# overlaps are recovered via _PREFIX_IMPLIED so per-keyword counts are
+# unchanged.
+_NEGATIVE_RE, _LONG_KW_RE, _SHORT_KW, _PREFIX_IMPLIED = build_scanners(
+    _POSITIVE_KEYWORDS, _NEGATIVE_KEYWORDS
+)
+
+
+_HIGH_RELEVANCE_SUBS = frozenset({
+    "backpain", "sciatica", "chronicpain", "physicaltherapy",
+    "pelvicfloor", "tmj", "posture", "ergonomics",
+})
+_MEDIUM_RELEVANCE_SUBS = frozenset({
+    "fibromyalgia", "flexibility", "bodyweightfitness",
+    "yogatherapy", "cancer", "cancerfighters", "breastcancer",
+    "advancedrunning", "ultrarunning",
+})
+
+
+def _base_for_subreddit(subreddit: str) -> float:
+    """Baseline score from subreddit reputation.
+
+    Broad subs (Fitness, CrossFit, golf, running, etc.) get a low base
+    (0.1) so only posts with 2+ keyword matches survive the 0.35
+    threshold.
+    """
+    sub_lower = subreddit.lower()
+    if sub_lower in _HIGH_RELEVANCE_SUBS:
+        return 0.4
+    if sub_lower in _MEDIUM_RELEVANCE_SUBS:
+        return 0.25
+    return 0.1
+
+
+def _score_title(title_lower: str, words: set[str], base: float) -> float:
+    """Score a pre-lowered title against the keyword lists.
 
+    Takes the subreddit base and pre-tokenized words so the filter
+    loop can compute them once per subreddit / per post.
+    """
+    # Check negative keywords first — strong disqualifier
+    if _NEGATIVE_RE.search(title_lower):
+        return 0.0
+
+    # Keyword match scoring — strong matches worth 0.2, weak worth 0.1.
+    # Long keywords come from one scan of the title; short words
+    # ("back", "hip", "knee") require a word boundary to avoid
+    # "back off", "hip hop", "knee-jerk reaction to..."
+    found = set(_LONG_KW_RE.findall(title_lower))
+    for kw in tuple(found):
+        found |= _PREFIX_IMPLIED[kw]
+    strong_matches = len(found)
+
+    weak_matches = len(words & _SHORT_KW)
+
+    keyword_score = min(strong_matches * 0.2 + weak_matches * 0.1, 0.6)
 
+    return min(base + keyword_score, 1.0)
+
+
+@functools.lru_cache(maxsize=8192)
 def score_post_relevance(title: str, subreddit: str = "") -> float:
     """Score a Reddit post's relevance from 0.0 to 1.0.
 
     Uses keyword matching on the title (case-insensitive).
     Pain/therapy subreddits get a baseline boost.
     Broad subs require strong keyword matches to pass threshold.
+    Memoized, since the same titles recur across feeds and snapshots
+    within a run.
     """
     title_lower = title.lower()
     # Tokenize for word-boundary matching of short ambiguous terms
     words = set(title_lower.split())
-
-    # Check negative keywords first — strong disqualifier
-    for neg in _NEGATIVE_KEYWORDS:
-        if neg in title_lower:
-            return 0.0
-
-    # Base score from subreddit reputation
-    high_relevance_subs = {
-        "backpain", "sciatica", "chronicpain", "physicaltherapy",
-        "pelvicfloor", "tmj", "posture", "ergonomics",
-    }
-    medium_relevance_subs = {
-        "fibromyalgia", "flexibility", "bodyweightfitness",
-        "yogatherapy", "cancer", "cancerfighters", "breastcancer",
-        "advancedrunning", "ultrarunning",
-    }
-    # Broad subs (Fitness, CrossFit, golf, running, etc.) get low base (0.1)
-    # so only posts with 2+ keyword matches survive the 0.35 threshold
-
-    sub_lower = subreddit.lower()
-    if sub_lower in high_relevance_subs:
-        base = 0.4
-    elif sub_lower in medium_relevance_subs:
-        base = 0.25
-    else:
-        base = 0.1
-
-    # Keyword match scoring — strong matches worth 0.2, weak worth 0.1
-    strong_matches = 0
-    weak_matches = 0
-    for kw in _POSITIVE_KEYWORDS:
-        if len(kw) <= 4:
-            # Short words ("back", "hip", "knee") — require word boundary
-            # to avoid "back off", "hip hop", "knee-jerk reaction to..."
-            if kw in words:
-                weak_matches += 1
-        else:
-            # Multi-char keywords — substring match is fine
-            if kw in title_lower:
-                strong_matches += 1
-
-    keyword_score = min(strong_matches * 0.2 + weak_matches * 0.1, 0.6)
-
-    return min(base + keyword_score, 1.0)
+    return _score_title(title_lower, words, _base_for_subreddit(subreddit))
 
 
 def filter_reddit_posts(
@@ -160,28 +189,42 @@ def filter_reddit_posts(
             continue
 
         total_before += len(posts)
-        scored = []
-        for post in posts:
-            title = post.get("title", "")
-            score = score_post_relevance(title, sub)
-            if score >= min_relevance:
-                post["relevance_score"] = round(score, 2)
-                scored.append(post)
-
-        # Sort by relevance, then by Reddit score
-        scored.sort(
-            key=lambda p: (p.get("relevance_score", 0), p.get("score", 0)),
-            reverse=True,
-        )
-
-        if scored:
-            filtered[sub] = scored[:max_per_sub]
+        base = _base_for_subreddit(sub)
+        # Bounded min-heap of the top max_per_sub posts: scoring,
+        # filtering, and ranking fuse into one pass, so memory stays
+        # O(max_per_sub) and irrelevant posts never hit the heap. The
+        # negated index tie-break reproduces the stable sort's
+        # earliest-first ordering among equal (relevance, score) keys.
+        heap: list[tuple[tuple[float, int], int, dict[str, Any]]] = []
+        for idx, post in enumerate(posts):
+            title_lower = post.get("title", "").lower()
+            # Stash the lowered title (underscore-prefixed = internal) so
+            # downstream stages (theme keyword extraction) can reuse it
+            # instead of lowering the same title again.
+            post["_title_lower"] = title_lower
+            score = _score_title(title_lower, set(title_lower.split()), base)
+            if score < min_relevance:
+                continue
+            post["relevance_score"] = round(score, 2)
+            key = (post["relevance_score"], post.get("score", 0))
+            if len(heap) < max_per_sub:
+                heapq.heappush(heap, (key, -idx, post))
+            elif (key, -idx) > heap[0][:2]:
+                heapq.heapreplace(heap, (key, -idx, post))
+
+        if heap:
+            # Sort by relevance, then by Reddit score
+            heap.sort(key=lambda item: item[:2], reverse=True)
+            filtered[sub] = [post for _, _, post in heap]
             total_after += len(filtered[sub])
 
+    # Level-gated and lazily formatted — no stdout write (or string
+    # formatting) when the run has logging filtered or redirected
     if filtered:
-        print(f"[Reddit Filter] Kept {total_after}/{total_before} posts "
-              f"({total_after/max(total_before,1)*100:.0f}% relevant)")
+        log.info("[Reddit Filter] Kept %d/%d posts (%.0f%% relevant)",
+                 total_after, total_before,
+                 total_after / max(total_before, 1) * 100)
     else:
-        print("[Reddit Filter] No relevant posts found after filtering")
+        log.info("[Reddit Filter] No relevant posts found after filtering")
 
     return filtered if filtered else None
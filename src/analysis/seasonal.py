@@ -199,8 +199,46 @@ SEASONAL_CALENDAR: dict[str, dict[str, Any]] = {
 }
 
 
+# Angle and keyword lists are handed out by reference from
+# get_seasonal_context, so freeze them to tuples once here rather than
+# copying them on every call.
+for _entry in SEASONAL_CALENDAR.values():
+    _entry["suggested_angles"] = tuple(_entry["suggested_angles"])
+    _entry["trending_keywords_boost"] = tuple(_entry["trending_keywords_boost"])
+
+
+# O(1) membership companions to the ordered tuples above. The tuples
+# stay authoritative for rendering (templates join them in calendar
+# order); presence probes should hit these frozensets instead of
+# scanning, and _KEYWORD_TO_SEASONS answers the inverse question
+# ("which seasons boost this keyword?") across the whole calendar.
+_BOOST_SETS: dict[str, frozenset[str]] = {
+    _key: frozenset(_entry["trending_keywords_boost"])
+    for _key, _entry in SEASONAL_CALENDAR.items()
+}
+
+_KEYWORD_TO_SEASONS: dict[str, tuple[str, ...]] = {}
+for _key, _entry in SEASONAL_CALENDAR.items():
+    for _kw in _entry["trending_keywords_boost"]:
+        _KEYWORD_TO_SEASONS[_kw] = _KEYWORD_TO_SEASONS.get(_kw, ()) + (_key,)
+
+
 # ─── Internal: month -> seasonal key lookup ──────────────────────────
 
+# Months are dense 1-12 integers and the calendar is static, so the
+# mapping is flattened into a 13-entry tuple at import (index 0 unused)
+# and lookup is a single index instead of a scan over the calendar.
+def _build_month_table() -> tuple[str, ...]:
+    table = [""] * 13
+    for key, data in SEASONAL_CALENDAR.items():
+        for m in data["months"]:
+            table[m] = key
+    return tuple(table)
+
+
+_MONTH_TO_KEY: tuple[str, ...] = _build_month_table()
+
+
 def _month_to_season_key(month: int) -> str:
     """Map a calendar month (1-12) to its SEASONAL_CALENDAR key.
 
@@ -210,9 +248,8 @@ def _month_to_season_key(month: int) -> str:
     Returns:
         The string key into ``SEASONAL_CALENDAR``.
     """
-    for key, data in SEASONAL_CALENDAR.items():
-        if month in data["months"]:
-            return key
+    if 1 <= month <= 12:
+        return _MONTH_TO_KEY[month] or "january"
     # Defensive fallback — should never happen with complete calendar
     return "january"
 
@@ -241,9 +278,9 @@ def get_seasonal_context(date: datetime.date | None = None) -> dict[str, Any]:
           e.g. ``"RTO Wave"``.
         - ``context_note`` (str): 1-2 sentence seasonal insight for
           strategy prompts.
-        - ``suggested_angles`` (list[str]): 2-3 content angles tied
-          to the season.
-        - ``trending_keywords_boost`` (list[str]): Keywords that
+        - ``suggested_angles`` (tuple[str, ...]): 2-3 content angles
+          tied to the season.
+        - ``trending_keywords_boost`` (tuple[str, ...]): Keywords that
           historically spike this time of year.
         - ``month`` (int): The evaluated month.
         - ``date`` (str): ISO-formatted date string.
@@ -265,8 +302,8 @@ def get_seasonal_context(date: datetime.date | None = None) -> dict[str, Any]:
     return {
         "season_name": entry["season_name"],
         "context_note": entry["context_note"],
-        "suggested_angles": list(entry["suggested_angles"]),
-        "trending_keywords_boost": list(entry["trending_keywords_boost"]),
+        "suggested_angles": entry["suggested_angles"],
+        "trending_keywords_boost": entry["trending_keywords_boost"],
         "month": date.month,
         "date": date.isoformat(),
     }
@@ -20,40 +20,60 @@ from analysis.body_part_groups import (
     select_theme_from_groups,
 )
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional — fall back to pure-Python paths
+    np = None
 
-def _google_movers(google: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
-    """Sort Google Trends keywords by wow_pct descending.
 
-    Skips entries where wow_pct is None.
+def _top_google_mover(google: dict[str, dict[str, Any]]) -> dict[str, Any] | None:
+    """Find the Google Trends keyword with the highest wow_pct.
+
+    Skips entries where wow_pct is None. A single O(n) max pass — the
+    analysis only surfaces the top mover, so there is no need to build
+    and sort the full mover list (or compute composites for the rest).
 
     Returns:
-        A list of dicts with ``keyword``, ``current``, ``wow_pct``, and
-        ``composite`` keys, sorted from largest positive WoW change to
-        smallest. The ``composite`` field uses volume-weighted scoring
-        from :func:`analysis.body_part_groups.compute_composite_score`.
+        A dict with ``keyword``, ``current``, ``wow_pct``, and
+        ``composite`` keys, or ``None`` if no entry qualifies. The
+        ``composite`` field uses volume-weighted scoring from
+        :func:`analysis.body_part_groups.compute_composite_score`.
     """
-    movers: list[dict[str, Any]] = []
+    best_keyword: str | None = None
+    best_data: dict[str, Any] = {}
+    best_wow = 0.0
     for keyword, data in google.items():
         wow = data.get("wow_pct")
         if wow is not None:
-            current = data.get("current", 0)
-            four_w_avg = data.get("4w_avg", 0)
-            movers.append({
-                "keyword": keyword,
-                "current": current,
-                "wow_pct": float(wow),
-                "prev_week": data.get("prev_week", 0),
-                "4w_trend": data.get("4w_trend", "stable"),
-                "4w_avg": four_w_avg,
-                "composite": compute_composite_score(current, wow, four_w_avg),
-            })
-    movers.sort(key=lambda m: m["wow_pct"], reverse=True)
-    return movers
+            wow = float(wow)
+            if best_keyword is None or wow > best_wow:
+                best_keyword = keyword
+                best_data = data
+                best_wow = wow
+
+    if best_keyword is None:
+        return None
+
+    current = best_data.get("current", 0)
+    four_w_avg = best_data.get("4w_avg", 0)
+    return {
+        "keyword": best_keyword,
+        "current": current,
+        "wow_pct": best_wow,
+        "prev_week": best_data.get("prev_week", 0),
+        "4w_trend": best_data.get("4w_trend", "stable"),
+        "4w_avg": four_w_avg,
+        "composite": compute_composite_score(current, best_wow, four_w_avg),
+    }
 
 
 def _wiki_movers(wikipedia: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
     """Sort Wikipedia articles by wow_pct descending.
 
+    When numpy is available the ranking is a single vectorized stable
+    argsort over the wow_pct column instead of a keyed Python sort;
+    both paths order ties identically (insertion order).
+
     Returns:
         A list of dicts with ``article`` and ``wow_pct`` keys,
         sorted from largest positive WoW change to smallest.
@@ -68,10 +88,43 @@ def _wiki_movers(wikipedia: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
                 "current_avg": data.get("current_week_avg", data.get("current_avg", 0)),
                 "prior_avg": data.get("prior_week_avg", data.get("prior_avg", 0)),
             })
+
+    if np is not None and movers:
+        wow_col = np.fromiter(
+            (m["wow_pct"] for m in movers), dtype=np.float64, count=len(movers)
+        )
+        order = np.argsort(-wow_col, kind="stable")
+        return [movers[i] for i in order.tolist()]
+
     movers.sort(key=lambda m: m["wow_pct"], reverse=True)
     return movers
 
 
+def _top_wiki_mover(wikipedia: dict[str, dict[str, Any]]) -> dict[str, Any] | None:
+    """Find the Wikipedia article with the highest wow_pct.
+
+    Same single-pass max as :func:`_top_google_mover` — used when only
+    the top mover is needed, not the full ranked list.
+
+    Returns:
+        A dict with ``article``, ``wow_pct``, ``current_avg``, and
+        ``prior_avg`` keys, or ``None`` if no entry qualifies.
+    """
+    best: dict[str, Any] | None = None
+    for article, data in wikipedia.items():
+        wow = data.get("wow_pct")
+        if wow is not None:
+            wow = float(wow)
+            if best is None or wow > best["wow_pct"]:
+                best = {
+                    "article": article,
+                    "wow_pct": wow,
+                    "current_avg": data.get("current_week_avg", data.get("current_avg", 0)),
+                    "prior_avg": data.get("prior_week_avg", data.get("prior_avg", 0)),
+                }
+    return best
+
+
 _PAIN_KEYWORDS: set[str] = {
     "pain", "back", "neck", "hip", "knee", "shoulder",
     "posture", "sciatica", "headache", "ankle", "wrist",
@@ -93,7 +146,7 @@ def _best_reddit_keyword(reddit: dict[str, list[dict[str, Any]]]) -> str | None:
     """
     best_score = -1
     best_subreddit: str | None = None
-    best_title: str = ""
+    best_post: dict[str, Any] | None = None
 
     for subreddit, posts in reddit.items():
         if not isinstance(posts, list):
@@ -105,22 +158,24 @@ def _best_reddit_keyword(reddit: dict[str, list[dict[str, Any]]]) -> str | None:
             if score > best_score:
                 best_score = score
                 best_subreddit = subreddit
-                best_title = str(post.get("title", ""))
+                best_post = post
 
-    if best_subreddit is None:
+    if best_subreddit is None or best_post is None:
         return None
 
-    # Try to extract a real keyword from the top post's title
-    if best_title:
-        title_lower = best_title.lower()
-        title_words = set(title_lower.split())
-        matched = title_words & _PAIN_KEYWORDS
-        if matched:
-            # Return the longest matching word for specificity
-            # (e.g. "sciatica" over "back")
-            return max(matched, key=len)
+    # Try to extract a real keyword from the top post's title, reusing
+    # the lowered title stashed by filter_reddit_posts when present.
+    # One pass over the title words, keeping the longest keyword match
+    # for specificity (e.g. "sciatica" over "back"); no intermediate
+    # word set or intersection is allocated. Equal lengths keep the
+    # word that appears first in the title.
+    title_lower = best_post.get("_title_lower") or str(best_post.get("title", "")).lower()
+    longest: str | None = None
+    for word in title_lower.split():
+        if word in _PAIN_KEYWORDS and (longest is None or len(word) > len(longest)):
+            longest = word
 
-    return best_subreddit
+    return longest or best_subreddit
 
 
 def select_theme(
@@ -128,6 +183,8 @@ def select_theme(
     wikipedia: dict[str, dict[str, Any]] | None,
     reddit: dict[str, list[dict[str, Any]]] | None,
     prior_theme: str | None,
+    *,
+    groups: list[dict[str, Any]] | None = None,
 ) -> str:
     """Determine this week's primary theme for the trend brief.
 
@@ -147,13 +204,18 @@ def select_theme(
         wikipedia: Wikipedia pageview data dict, or ``None``.
         reddit: Reddit data dict mapping subreddits to post lists, or ``None``.
         prior_theme: The theme string from the prior week, or ``None``.
+        groups: Precomputed body-part groups for ``google`` (from
+            :func:`group_keywords_by_body_part`). Computed here when not
+            supplied; callers that already hold the groups (like
+            :func:`build_analysis`) pass them in to avoid regrouping.
 
     Returns:
         A theme string suitable for use as the brief's headline topic.
     """
     # ── PRIMARY: Body-part group composite scoring ──────────────────
     if google:
-        groups = group_keywords_by_body_part(google)
+        if groups is None:
+            groups = group_keywords_by_body_part(google)
         if groups:
             theme = select_theme_from_groups(groups, prior_theme)
             if theme != "General Pain Management":
@@ -193,14 +255,13 @@ def _extract_top_mover(
         A dict with mover details, or ``None`` if no data is available.
     """
     if google:
-        movers = _google_movers(google)
-        if movers:
-            return movers[0]
+        top = _top_google_mover(google)
+        if top is not None:
+            return top
 
     if wikipedia:
-        movers = _wiki_movers(wikipedia)
-        if movers:
-            top = movers[0]
+        top = _top_wiki_mover(wikipedia)
+        if top is not None:
             return {
                 "keyword": top["article"].replace("_", " "),
                 "current": top.get("current_avg", 0),
@@ -246,7 +307,7 @@ def build_analysis(
         auto-selected ``theme`` and ``top_mover`` fields.
     """
     groups = group_keywords_by_body_part(google)
-    theme = select_theme(google, wikipedia, reddit, prior_theme)
+    theme = select_theme(google, wikipedia, reddit, prior_theme, groups=groups)
     top_mover = _extract_top_mover(google, wikipedia)
 
     return {
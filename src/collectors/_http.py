@@ -0,0 +1,101 @@
+"""
+Shared HTTP session pool for collectors.
+
+Reusing one keep-alive ``requests.Session`` per host amortizes TCP and
+TLS handshakes plus DNS resolution across the dozens of calls a
+collection run makes to the same APIs, instead of paying them on every
+``requests.get``. Sessions are created lazily, cached for the life of
+the process, and closed at interpreter exit.
+
+Also provides :func:`cached_get`, a GET wrapper with a small on-disk
+TTL cache so repeated runs (development, retries after a crash) do not
+re-spend rate-limit budget on feeds that barely change within the hour.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_HTTP_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "http_cache"
+
+_SESSIONS: dict[str, requests.Session] = {}
+_LOCK = threading.Lock()
+
+
+def get_session(host: str) -> requests.Session:
+    """Return the shared keep-alive session for ``host``.
+
+    The host string is only a cache key — callers still pass full URLs
+    to the session. Keying by host keeps each API's connection pool
+    (and any cookies a service sets) isolated from the others.
+    """
+    with _LOCK:
+        session = _SESSIONS.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSIONS[host] = session
+        return session
+
+
+def cached_get(
+    host: str,
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: int = 15,
+    ttl: float = 3600.0,
+    pace: Callable[[], None] | None = None,
+    validate: Callable[[bytes], bool] | None = None,
+) -> tuple[int, bytes]:
+    """GET through the shared session pool with an on-disk TTL cache.
+
+    Returns ``(status_code, body)``. Only 200 responses are cached
+    (keyed by URL + sorted params, so rotating headers don't fragment
+    the cache); error statuses pass through untouched and the
+    collectors keep their own handling. ``pace`` is a rate-limit hook
+    invoked only when the request actually goes out — cache hits cost
+    nothing against the rate budget. ``validate`` can veto caching of
+    a 200 body that is really an error page (CAPTCHA interstitials).
+    """
+    key = hashlib.sha256(
+        repr((url, sorted((params or {}).items()))).encode()
+    ).hexdigest()
+    cache_file = _HTTP_CACHE_DIR / f"{key}.bin"
+    try:
+        if cache_file.exists() and time.time() - cache_file.stat().st_mtime <= ttl:
+            return 200, cache_file.read_bytes()
+    except OSError:
+        pass
+
+    if pace is not None:
+        pace()
+    resp = get_session(host).get(url, params=params, headers=headers, timeout=timeout)
+
+    if resp.status_code == 200 and (validate is None or validate(resp.content)):
+        try:
+            _HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_bytes(resp.content)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # caching is best-effort
+    return resp.status_code, resp.content
+
+
+@atexit.register
+def _close_sessions() -> None:
+    for session in _SESSIONS.values():
+        session.close()
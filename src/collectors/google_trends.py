@@ -4,7 +4,7 @@ Google Trends collector with multi-layer resilience.
 Architecture:
   Layer 1: trendspy library (active replacement for archived pytrends)
   Layer 2: File cache (12h TTL — avoids repeat 429s during testing)
-  Layer 3: Exponential backoff with jitter (30s base, random 5-30s added)
+  Layer 3: Full-jitter exponential backoff + adaptive request pacing
   Layer 4: Partial result acceptance (getting 40/60 keywords is fine)
   Layer 5: Stale cache fallback (any cached data beats no data)
 
@@ -14,18 +14,23 @@ successor with proxy support and smarter batch handling.
 
 from __future__ import annotations
 
+import itertools
 import json
+import os
 import random
+import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 # Cache location
 _CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 _CACHE_TRENDS = _CACHE_DIR / "cache_trends.json"
 _CACHE_RISING = _CACHE_DIR / "cache_rising.json"
 _CACHE_TTL_HOURS = 12
+_STALE_MAX_HOURS = 72
+_CIRCUIT_FILE = _CACHE_DIR / "circuit_state.json"
 
 # Try trendspy first (actively maintained), fall back to pytrends
 _ENGINE = None
@@ -42,22 +47,67 @@ if _ENGINE is None:
     except ImportError:
         pass
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional — fall back to pure-Python paths
+    np = None
+
+try:
+    import orjson  # optional — much faster (de)serialization of the cache files
+except ImportError:
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Cache helpers
 # ---------------------------------------------------------------------------
 
+# Parsed payloads memoized on file mtime. A single run consults the
+# same cache file several times (fresh check, stale check, last-resort
+# fallback), and the JSON runs to hundreds of KB — parse each on-disk
+# version once.
+_PAYLOAD_MEMO: dict[Path, tuple[float, dict]] = {}
+
+
+def _read_payload(cache_file: Path) -> dict | None:
+    """Read and parse a cache file, memoized on its mtime."""
+    try:
+        mtime = cache_file.stat().st_mtime
+    except OSError:
+        return None
+    memo = _PAYLOAD_MEMO.get(cache_file)
+    if memo is not None and memo[0] == mtime:
+        return memo[1]
+    try:
+        data = cache_file.read_bytes()
+        raw = orjson.loads(data) if orjson else json.loads(data)
+    except Exception:
+        return None
+    _PAYLOAD_MEMO[cache_file] = (mtime, raw)
+    return raw
+
+
+def _stamp_age_seconds(stamp: Any, now: float) -> float:
+    """Age in seconds of a cache stamp.
+
+    Stamps are epoch floats; ISO strings from files written before the
+    switch are still accepted.
+    """
+    if isinstance(stamp, str):
+        stamp = datetime.fromisoformat(stamp).timestamp()
+    return now - stamp
+
+
 def _load_cache(cache_file: Path, max_age_hours: int = _CACHE_TTL_HOURS) -> dict | None:
     """Load cached data if within TTL."""
-    if not cache_file.exists():
+    raw = _read_payload(cache_file)
+    if raw is None:
         return None
     try:
-        raw = json.loads(cache_file.read_text())
-        cached_at = datetime.fromisoformat(raw.get("_cached_at", "2000-01-01"))
-        age = datetime.now() - cached_at
-        if age > timedelta(hours=max_age_hours):
+        age_s = _stamp_age_seconds(raw.get("_cached_at", 0.0), time.time())
+        if age_s > max_age_hours * 3600:
             return None
-        print(f"[Google Trends] Using cache ({age.seconds // 60}m old)")
+        print(f"[Google Trends] Using cache ({int(age_s) // 60}m old)")
         return raw.get("results")
     except Exception:
         return None
@@ -65,30 +115,230 @@ def _load_cache(cache_file: Path, max_age_hours: int = _CACHE_TTL_HOURS) -> dict
 
 def _load_stale_cache(cache_file: Path) -> dict | None:
     """Load cache regardless of age — last resort fallback."""
-    if not cache_file.exists():
+    raw = _read_payload(cache_file)
+    if raw is None:
         return None
+    cached_at = raw.get("_cached_at", "unknown")
+    if isinstance(cached_at, (int, float)):
+        cached_at = datetime.fromtimestamp(cached_at).isoformat(timespec="seconds")
+    print(f"[Google Trends] Using STALE cache from {cached_at}")
+    return raw.get("results")
+
+
+def _load_cache_any(cache_file: Path) -> tuple[dict | None, float | None]:
+    """Load cached results with their age in hours, regardless of TTL."""
+    raw = _read_payload(cache_file)
+    if raw is None:
+        return None, None
     try:
-        raw = json.loads(cache_file.read_text())
-        cached_at = raw.get("_cached_at", "unknown")
-        print(f"[Google Trends] Using STALE cache from {cached_at} (all live requests failed)")
-        return raw.get("results")
+        age_s = _stamp_age_seconds(raw.get("_cached_at", 0.0), time.time())
+        return raw.get("results"), age_s / 3600
     except Exception:
-        return None
+        return None, None
 
 
-def _save_cache(cache_file: Path, results: dict) -> None:
-    """Save data to cache file."""
+def _split_by_freshness(
+    cache_file: Path,
+    keywords: list[str],
+    max_age_hours: int = _CACHE_TTL_HOURS,
+) -> tuple[dict, list[str]]:
+    """Partition keywords into cached-fresh results and keywords to fetch.
+
+    Uses the per-keyword ``_keyword_fetched_at`` stamps so a partial
+    prior run (one that died to 429s midway) keeps its successful
+    keywords; older cache files without stamps fall back to the
+    file-level ``_cached_at``.
+    """
+    raw = _read_payload(cache_file)
+    if raw is None:
+        return {}, list(keywords)
+    results = raw.get("results") or {}
+    stamps = raw.get("_keyword_fetched_at") or {}
+    fallback = raw.get("_cached_at", 0.0)
+    now = time.time()
+    max_age_s = max_age_hours * 3600
+    fresh: dict = {}
+    missing: list[str] = []
+    for kw in keywords:
+        try:
+            age_s = _stamp_age_seconds(stamps.get(kw, fallback), now)
+        except (TypeError, ValueError):
+            age_s = float("inf")
+        if kw in results and age_s <= max_age_s:
+            fresh[kw] = results[kw]
+        else:
+            missing.append(kw)
+    return fresh, missing
+
+
+def _save_cache(cache_file: Path, results: dict, refreshed: set[str] | None = None) -> None:
+    """Save data to cache file, merged over the existing payload.
+
+    New results are unioned with whatever the file already holds, so a
+    partial refresh can never evict entries it didn't fetch — stale
+    entries must stay servable as the last-resort fallback. Keywords in
+    ``refreshed`` (all of ``results`` by default) are stamped with the
+    current time; carried-over keywords keep their prior stamp so a
+    partial refresh does not mask how old the merged-in data really is.
+    """
     _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    now = time.time()
+    prior = _read_payload(cache_file) or {}
+    prior_stamps = prior.get("_keyword_fetched_at") or {}
+    if refreshed is None:
+        refreshed = set(results)
+    merged = {**(prior.get("results") or {}), **results}
     payload = {
-        "_cached_at": datetime.now().isoformat(),
-        "results": results,
+        "_cached_at": now,
+        "results": merged,
+        "_keyword_fetched_at": {
+            kw: now if kw in refreshed
+            else prior_stamps.get(kw, prior.get("_cached_at", now))
+            for kw in merged
+        },
     }
     try:
-        cache_file.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+        # Write-then-rename so a concurrent reader (another CLI run, or
+        # the background refresh) never sees a half-written file
+        tmp_file = cache_file.with_suffix(cache_file.suffix + ".tmp")
+        if orjson:
+            tmp_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            tmp_file.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+        os.replace(tmp_file, cache_file)
+        _PAYLOAD_MEMO[cache_file] = (cache_file.stat().st_mtime, payload)
     except Exception as exc:
         print(f"[Google Trends] Cache write failed: {exc}")
 
 
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+class _AdaptiveLimiter:
+    """Congestion-aware pacing between Google Trends requests.
+
+    Replaces the fixed pessimistic inter-batch sleeps: the gap shrinks
+    10% after every successful request and doubles with decorrelated
+    jitter after a 429, so healthy runs stop paying worst-case delays
+    while rate-limited runs back off harder than before.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+    ) -> None:
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._next_allowed = 0.0
+
+    def acquire(self) -> None:
+        """Sleep until the next request is allowed, then arm the gap."""
+        wait = self._next_allowed - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._next_allowed = time.monotonic() + self.interval
+
+    def success(self) -> None:
+        """Narrow the gap after a clean response."""
+        self.interval = max(self.min_interval, self.interval * 0.9)
+
+    def throttled(self) -> None:
+        """Widen the gap after a 429, with decorrelated jitter."""
+        self.interval = min(
+            self.max_interval,
+            self.interval * 2.0 + random.uniform(0, self.interval),
+        )
+
+
+# Circuit breaker: when a whole run dies to consecutive 429s, the
+# in-process counters reset on the next invocation and it pays the full
+# multi-minute backoff again before giving up. Persisting the failure
+# count lets subsequent runs skip live fetching entirely while Google
+# is still rate limiting us, for 2 minutes doubling up to an hour.
+
+def _circuit_open() -> bool:
+    """True when recent tripped runs mean live fetching should be skipped."""
+    raw = _read_payload(_CIRCUIT_FILE)
+    if raw is None:
+        return False
+    try:
+        failures = int(raw.get("consecutive_failures", 0))
+        opened = float(raw.get("last_open_ts", 0.0))
+    except (TypeError, ValueError):
+        return False
+    if failures < 1:
+        return False
+    hold_s = min(3600, 60 * 2 ** failures)
+    return time.time() - opened < hold_s
+
+
+def _circuit_record(tripped: bool) -> None:
+    """Bump the failure counter after a tripped run, reset after a clean one."""
+    try:
+        if not tripped:
+            if _CIRCUIT_FILE.exists():
+                _CIRCUIT_FILE.unlink()
+                _PAYLOAD_MEMO.pop(_CIRCUIT_FILE, None)
+            return
+        prior = _read_payload(_CIRCUIT_FILE) or {}
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        state = {
+            "consecutive_failures": int(prior.get("consecutive_failures", 0)) + 1,
+            "last_open_ts": time.time(),
+        }
+        _CIRCUIT_FILE.write_text(json.dumps(state))
+        _PAYLOAD_MEMO[_CIRCUIT_FILE] = (_CIRCUIT_FILE.stat().st_mtime, state)
+    except Exception:
+        pass  # breaker state is best-effort; never block the run on it
+
+
+# Serializes background refreshes: only one stale-while-revalidate
+# fetch may be in flight at a time across both caches, since they both
+# hit the same Google rate limiter.
+_refresh_lock = threading.Lock()
+
+
+def _start_background_refresh(
+    fetch: Callable[[list[str]], dict],
+    cache_file: Path,
+    keywords: list[str],
+    label: str,
+) -> None:
+    """Kick off a daemon thread that refreshes a cache file.
+
+    No-ops when a refresh is already running, so repeated stale serves
+    cannot pile up parallel fetches (thundering herd).
+    """
+    if not _refresh_lock.acquire(blocking=False):
+        return
+
+    def _run() -> None:
+        try:
+            results = fetch(keywords)
+            if results:
+                _save_cache(cache_file, results)
+                print(f"[{label}] Background refresh complete ({len(results)} keywords)")
+        finally:
+            _refresh_lock.release()
+
+    threading.Thread(target=_run, daemon=True, name=f"{label}-refresh").start()
+
+
+def _backoff_sleep(attempt: int, base: float = 2.0, cap: float = 300.0) -> float:
+    """Full-jitter retry wait: uniform over the exponential window.
+
+    Sampling the whole [0, base * 2**attempt] window (rather than
+    exponential-plus-small-jitter) de-correlates retries across clients
+    hitting the same limiter, which empirically lowers both total retry
+    count and completion time under contention.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
 # ---------------------------------------------------------------------------
 # Metrics helpers
 # ---------------------------------------------------------------------------
@@ -100,20 +350,11 @@ def _pct_change(old: float, new: float) -> float | None:
     return round(((new - old) / old) * 100, 2)
 
 
-def _trend_direction(values: list[float]) -> str:
-    """Determine trend from a time series: rising, falling, or stable."""
-    if not values or len(values) < 2:
-        return "stable"
-
-    midpoint = len(values) // 2
-    first_half_avg = sum(values[:midpoint]) / max(len(values[:midpoint]), 1)
-    second_half_avg = sum(values[midpoint:]) / max(len(values[midpoint:]), 1)
-
+def _direction_from_halves(first_half_avg: float, second_half_avg: float) -> str:
+    """Classify a series as rising/falling/stable from its half averages."""
     if first_half_avg == 0:
         return "rising" if second_half_avg > 0 else "stable"
-
     change = ((second_half_avg - first_half_avg) / first_half_avg) * 100
-
     if change > 5:
         return "rising"
     elif change < -5:
@@ -121,14 +362,52 @@ def _trend_direction(values: list[float]) -> str:
     return "stable"
 
 
-def _compute_metrics(series: list) -> dict[str, Any]:
-    """Compute trend metrics from a time series."""
+def _trend_direction(values: np.ndarray | list[float]) -> str:
+    """Determine trend from a time series: rising, falling, or stable."""
+    if len(values) < 2:
+        return "stable"
+
+    midpoint = len(values) // 2
+    if np is not None and isinstance(values, np.ndarray):
+        first_half_avg = float(values[:midpoint].mean())
+        second_half_avg = float(values[midpoint:].mean())
+    else:
+        first_half_avg = sum(values[:midpoint]) / max(midpoint, 1)
+        second_half_avg = sum(values[midpoint:]) / max(len(values) - midpoint, 1)
+
+    return _direction_from_halves(first_half_avg, second_half_avg)
+
+
+def _compute_metrics(series: np.ndarray | list) -> dict[str, Any]:
+    """Compute trend metrics from a time series.
+
+    Accepts the DataFrame column as an ndarray directly (slices are
+    views and the averages run vectorized); the no-numpy list path uses
+    a single prefix-sum pass so the window and half-window averages
+    need no slice copies. Scalars are cast back to Python types for
+    JSON serialization.
+    """
     current = int(series[-1])
     prev_week = int(series[-8]) if len(series) >= 8 else int(series[0])
     wow_pct = _pct_change(prev_week, current)
-    four_weeks = series[-28:] if len(series) >= 28 else series
-    four_w_avg = round(sum(four_weeks) / len(four_weeks), 2)
-    four_w_trend = _trend_direction(four_weeks)
+    if np is not None and isinstance(series, np.ndarray):
+        four_weeks = series[-28:] if len(series) >= 28 else series
+        four_w_avg = round(float(four_weeks.mean()), 2)
+        four_w_trend = _trend_direction(four_weeks)
+    else:
+        prefix = list(itertools.accumulate(series))
+        n = len(series)
+        start = n - 28 if n >= 28 else 0
+        window = n - start
+        before = prefix[start - 1] if start else 0
+        four_w_avg = round((prefix[-1] - before) / window, 2)
+        if window < 2:
+            four_w_trend = "stable"
+        else:
+            mid = start + window // 2
+            first_half_avg = (prefix[mid - 1] - before) / (mid - start)
+            second_half_avg = (prefix[-1] - prefix[mid - 1]) / (n - mid)
+            four_w_trend = _direction_from_halves(first_half_avg, second_half_avg)
     return {
         "current": current,
         "prev_week": prev_week,
@@ -158,6 +437,7 @@ def _fetch_trendspy(
     results: dict[str, dict[str, Any]] = {}
     batches = [keywords[i : i + batch_size] for i in range(0, len(keywords), batch_size)]
     consecutive_429s = 0
+    limiter = _AdaptiveLimiter()
 
     for batch_idx, batch in enumerate(batches):
         if consecutive_429s >= 3:
@@ -170,8 +450,9 @@ def _fetch_trendspy(
         print(f"[Google Trends] Batch {batch_idx + 1}/{len(batches)}: {batch}")
 
         success = False
-        for attempt in range(3):
+        for attempt in range(5):
             try:
+                limiter.acquire()
                 df = tr.interest_over_time(batch, timeframe="today 3-m", geo="US")
 
                 if df is not None and not df.empty:
@@ -179,11 +460,12 @@ def _fetch_trendspy(
                         df = df.drop(columns=["isPartial"])
                     for kw in batch:
                         if kw in df.columns:
-                            series = df[kw].tolist()
-                            if series:
+                            series = df[kw].to_numpy()
+                            if len(series):
                                 results[kw] = _compute_metrics(series)
 
                 consecutive_429s = 0
+                limiter.success()
                 success = True
                 break
 
@@ -191,10 +473,11 @@ def _fetch_trendspy(
                 error_msg = str(exc)
                 if "429" in error_msg:
                     consecutive_429s += 1
-                    wait = (30 * (2 ** attempt)) + random.randint(5, 30)
+                    limiter.throttled()
+                    wait = _backoff_sleep(attempt)
                     print(
                         f"[Google Trends] 429 on batch {batch_idx + 1}, "
-                        f"attempt {attempt + 1}/3. Waiting {wait}s..."
+                        f"attempt {attempt + 1}/5. Waiting {wait:.0f}s..."
                     )
                     time.sleep(wait)
                     tr = _new_trendspy_session()  # fresh session
@@ -205,11 +488,7 @@ def _fetch_trendspy(
         if not success:
             print(f"[Google Trends] Skipping batch {batch_idx + 1} after failures")
 
-        # Delay between batches — randomized to avoid pattern detection
-        if batch_idx < len(batches) - 1:
-            delay = 25 + random.randint(5, 20)
-            time.sleep(delay)
-
+    _circuit_record(consecutive_429s >= 3)
     return results
 
 
@@ -225,6 +504,7 @@ def _fetch_rising_trendspy(
     tr = _new_trendspy_session()
     results: dict[str, dict[str, list[dict[str, Any]]]] = {}
     consecutive_429s = 0
+    limiter = _AdaptiveLimiter()
 
     for kw_idx, kw in enumerate(keywords):
         if consecutive_429s >= 3:
@@ -237,8 +517,9 @@ def _fetch_rising_trendspy(
         if (kw_idx % 10 == 0) or kw_idx == len(keywords) - 1:
             print(f"[Rising Queries] Keyword {kw_idx + 1}/{len(keywords)}: {kw}")
 
-        for attempt in range(2):
+        for attempt in range(3):
             try:
+                limiter.acquire()
                 related = tr.related_queries(kw, timeframe="today 3-m", geo="US")
                 if related:
                     # trendspy returns {keyword: {rising: df, top: df}}
@@ -249,23 +530,22 @@ def _fetch_rising_trendspy(
                         results[kw] = {"rising": rising_list, "top": top_list}
 
                 consecutive_429s = 0
+                limiter.success()
                 break
 
             except Exception as exc:
                 if "429" in str(exc):
                     consecutive_429s += 1
-                    wait = (30 * (2 ** attempt)) + random.randint(5, 30)
-                    print(f"[Rising Queries] 429 on '{kw}', waiting {wait}s...")
+                    limiter.throttled()
+                    wait = _backoff_sleep(attempt)
+                    print(f"[Rising Queries] 429 on '{kw}', waiting {wait:.0f}s...")
                     time.sleep(wait)
                     tr = _new_trendspy_session()
                 else:
                     print(f"[Rising Queries] Error on '{kw}': {exc}")
                     break
 
-        # Delay between keywords
-        if kw_idx < len(keywords) - 1:
-            time.sleep(5 + random.randint(2, 8))
-
+    _circuit_record(consecutive_429s >= 3)
     return results
 
 
@@ -282,6 +562,7 @@ def _fetch_pytrends(
     results: dict[str, dict[str, Any]] = {}
     batches = [keywords[i : i + batch_size] for i in range(0, len(keywords), batch_size)]
     consecutive_429s = 0
+    limiter = _AdaptiveLimiter()
 
     for batch_idx, batch in enumerate(batches):
         if consecutive_429s >= 3:
@@ -294,8 +575,9 @@ def _fetch_pytrends(
         print(f"[Google Trends] Batch {batch_idx + 1}/{len(batches)}: {batch}")
 
         success = False
-        for attempt in range(3):
+        for attempt in range(5):
             try:
+                limiter.acquire()
                 pytrends.build_payload(batch, cat=0, timeframe="today 3-m", geo="US")
                 df = pytrends.interest_over_time()
                 if df is not None and not df.empty:
@@ -303,19 +585,21 @@ def _fetch_pytrends(
                         df = df.drop(columns=["isPartial"])
                     for kw in batch:
                         if kw in df.columns:
-                            series = df[kw].tolist()
-                            if series:
+                            series = df[kw].to_numpy()
+                            if len(series):
                                 results[kw] = _compute_metrics(series)
                 consecutive_429s = 0
+                limiter.success()
                 success = True
                 break
 
             except Exception as exc:
                 if "429" in str(exc):
                     consecutive_429s += 1
-                    wait = (30 * (2 ** attempt)) + random.randint(5, 30)
+                    limiter.throttled()
+                    wait = _backoff_sleep(attempt)
                     print(
-                        f"[Google Trends] 429, attempt {attempt + 1}/3. Waiting {wait}s..."
+                        f"[Google Trends] 429, attempt {attempt + 1}/5. Waiting {wait:.0f}s..."
                     )
                     time.sleep(wait)
                     pytrends = TrendReq(hl="en-US", tz=360, timeout=(10, 25))
@@ -326,10 +610,7 @@ def _fetch_pytrends(
         if not success:
             print(f"[Google Trends] Skipping batch {batch_idx + 1}")
 
-        if batch_idx < len(batches) - 1:
-            delay = 20 + random.randint(5, 15)
-            time.sleep(delay)
-
+    _circuit_record(consecutive_429s >= 3)
     return results
 
 
@@ -342,6 +623,7 @@ def _fetch_rising_pytrends(
     results: dict[str, dict[str, list[dict[str, Any]]]] = {}
     batches = [keywords[i : i + batch_size] for i in range(0, len(keywords), batch_size)]
     consecutive_429s = 0
+    limiter = _AdaptiveLimiter()
 
     for batch_idx, batch in enumerate(batches):
         if consecutive_429s >= 3:
@@ -349,8 +631,9 @@ def _fetch_rising_pytrends(
 
         print(f"[Rising Queries] Batch {batch_idx + 1}/{len(batches)}: {batch}")
 
-        for attempt in range(2):
+        for attempt in range(3):
             try:
+                limiter.acquire()
                 pytrends.build_payload(batch, cat=0, timeframe="today 3-m", geo="US")
                 related = pytrends.related_queries()
                 if related:
@@ -363,21 +646,20 @@ def _fetch_rising_pytrends(
                         if rising_list or top_list:
                             results[kw] = {"rising": rising_list, "top": top_list}
                 consecutive_429s = 0
+                limiter.success()
                 break
 
             except Exception as exc:
                 if "429" in str(exc):
                     consecutive_429s += 1
-                    wait = (30 * (2 ** attempt)) + random.randint(5, 30)
+                    limiter.throttled()
+                    wait = _backoff_sleep(attempt)
                     time.sleep(wait)
                     pytrends = TrendReq(hl="en-US", tz=360, timeout=(10, 25))
                 else:
                     break
 
-        if batch_idx < len(batches) - 1:
-            delay = 20 + random.randint(5, 15)
-            time.sleep(delay)
-
+    _circuit_record(consecutive_429s >= 3)
     return results
 
 
@@ -386,15 +668,29 @@ def _fetch_rising_pytrends(
 # ---------------------------------------------------------------------------
 
 def _parse_df_to_list(df_or_none) -> list[dict[str, Any]]:
-    """Convert a pandas DataFrame of related queries to a list of dicts."""
+    """Convert a pandas DataFrame of related queries to a list of dicts.
+
+    Pulls the two columns out in bulk instead of iterating with
+    ``iterrows()``, which materializes a Series per row and dominates
+    the parse cost on larger query tables.
+    """
     if df_or_none is None:
         return []
     try:
         if hasattr(df_or_none, "empty") and df_or_none.empty:
             return []
+        n = len(df_or_none)
+        if "query" in df_or_none.columns:
+            queries = df_or_none["query"].astype(str).tolist()
+        else:
+            queries = [""] * n
+        if "value" in df_or_none.columns:
+            raw_values = df_or_none["value"].tolist()
+        else:
+            raw_values = [0] * n
+
         items = []
-        for _, row in df_or_none.iterrows():
-            value = row.get("value", 0)
+        for query, value in zip(queries, raw_values):
             if isinstance(value, str) and value.lower() == "breakout":
                 value = "Breakout"
             else:
@@ -402,7 +698,7 @@ def _parse_df_to_list(df_or_none) -> list[dict[str, Any]]:
                     value = int(value)
                 except (ValueError, TypeError):
                     value = 0
-            items.append({"query": str(row.get("query", "")), "value": value})
+            items.append({"query": query, "value": value})
         return items
     except Exception:
         return []
@@ -415,18 +711,25 @@ def _parse_df_to_list(df_or_none) -> list[dict[str, Any]]:
 def collect_google_trends(
     keywords_flat: list[str],
     use_cache: bool = False,
+    stale_age_hours: int = _STALE_MAX_HOURS,
 ) -> dict[str, dict[str, Any]] | None:
     """Collect Google Trends interest-over-time data.
 
     Multi-layer resilience:
-      1. Try trendspy (or pytrends as fallback)
-      2. On 429 — exponential backoff with jitter, accept partial results
-      3. On total failure — serve from 12h cache
-      4. On cache miss — serve from stale cache (any age)
+      1. Serve fresh (<12h) cache
+      2. Serve moderately stale cache (up to ``stale_age_hours``) while
+         a background thread revalidates it — keeps the minutes-long
+         live fetch off the critical path
+      3. Try trendspy (or pytrends as fallback) with jittered backoff,
+         accepting partial results
+      4. On total failure — serve from stale cache (any age)
 
     Args:
         keywords_flat: Keywords to query.
         use_cache: If True, skip live fetch and serve cached data only.
+        stale_age_hours: Maximum cache age served via the
+            stale-while-revalidate path before a blocking live fetch
+            is required.
 
     Returns:
         Dict mapping keyword -> metrics, or None on total failure.
@@ -449,23 +752,44 @@ def collect_google_trends(
             return cached
         return _load_stale_cache(_CACHE_TRENDS)
 
-    # Check fresh cache first — avoids redundant requests during testing
-    cached = _load_cache(_CACHE_TRENDS)
-    if cached:
-        return cached
-
-    # Live fetch
-    print(f"[Google Trends] Using {_ENGINE} engine for {len(keywords_flat)} keywords")
-
-    if _ENGINE == "trendspy":
-        results = _fetch_trendspy(keywords_flat)
-    else:
-        results = _fetch_pytrends(keywords_flat)
-
-    if results:
-        _save_cache(_CACHE_TRENDS, results)
-        print(f"[Google Trends] Collected data for {len(results)}/{len(keywords_flat)} keywords.")
-        return results
+    # Per-keyword freshness check — only expired or never-fetched
+    # keywords need live requests
+    fresh, missing = _split_by_freshness(_CACHE_TRENDS, keywords_flat)
+    if not missing:
+        print(f"[Google Trends] Using cache ({len(fresh)} keywords fresh)")
+        return fresh
+
+    # Circuit breaker: after runs that died to 429s, don't pay the full
+    # backoff again while Google is still rate limiting us
+    if _circuit_open():
+        print("[Google Trends] Circuit open after repeated 429 runs — skipping live fetch")
+        return _load_stale_cache(_CACHE_TRENDS) or fresh or None
+
+    fetch = _fetch_trendspy if _ENGINE == "trendspy" else _fetch_pytrends
+
+    # Stale-while-revalidate: serve a moderately stale cache right away
+    # and refresh it off the critical path (only when nothing is fresh —
+    # otherwise the partial fetch below is cheaper)
+    if not fresh:
+        stale, age = _load_cache_any(_CACHE_TRENDS)
+        if stale and age is not None and age <= stale_age_hours:
+            print(f"[Google Trends] Serving stale cache ({age:.0f}h old), refreshing in background")
+            _start_background_refresh(fetch, _CACHE_TRENDS, keywords_flat, "Google Trends")
+            return stale
+
+    # Live fetch for the gaps, merged over the still-fresh keywords
+    print(f"[Google Trends] Using {_ENGINE} engine for {len(missing)}/{len(keywords_flat)} keywords")
+    results = fetch(missing)
+
+    if results or fresh:
+        merged = {**fresh, **(results or {})}
+        if len(merged) < len(keywords_flat):
+            # Layer 4 for the keywords the fetch didn't cover: serve
+            # whatever the cache still holds for them, however old
+            merged = {**(_load_stale_cache(_CACHE_TRENDS) or {}), **merged}
+        _save_cache(_CACHE_TRENDS, merged, refreshed=set(results or {}))
+        print(f"[Google Trends] Collected data for {len(merged)}/{len(keywords_flat)} keywords.")
+        return merged
 
     # Fallback: stale cache
     stale = _load_stale_cache(_CACHE_TRENDS)
@@ -479,14 +803,17 @@ def collect_google_trends(
 def collect_rising_queries(
     keywords_flat: list[str],
     use_cache: bool = False,
+    stale_age_hours: int = _STALE_MAX_HOURS,
 ) -> dict[str, dict[str, list[dict[str, Any]]]] | None:
     """Collect rising and top related queries for each keyword.
 
-    Same multi-layer resilience as collect_google_trends.
+    Same multi-layer resilience as collect_google_trends, including the
+    stale-while-revalidate cache path.
 
     Args:
         keywords_flat: Keywords to query.
         use_cache: If True, serve cached data only.
+        stale_age_hours: Maximum cache age served while revalidating.
 
     Returns:
         Dict mapping keyword -> {rising: [...], top: [...]}, or None.
@@ -503,21 +830,34 @@ def collect_rising_queries(
             return cached
         return _load_stale_cache(_CACHE_RISING)
 
-    cached = _load_cache(_CACHE_RISING)
-    if cached:
-        return cached
-
-    print(f"[Rising Queries] Using {_ENGINE} engine")
-
-    if _ENGINE == "trendspy":
-        results = _fetch_rising_trendspy(keywords_flat)
-    else:
-        results = _fetch_rising_pytrends(keywords_flat)
-
-    if results:
-        _save_cache(_CACHE_RISING, results)
-        print(f"[Rising Queries] Collected queries for {len(results)} keywords.")
-        return results
+    fresh, missing = _split_by_freshness(_CACHE_RISING, keywords_flat)
+    if not missing:
+        print(f"[Rising Queries] Using cache ({len(fresh)} keywords fresh)")
+        return fresh
+
+    if _circuit_open():
+        print("[Rising Queries] Circuit open after repeated 429 runs — skipping live fetch")
+        return _load_stale_cache(_CACHE_RISING) or fresh or None
+
+    fetch = _fetch_rising_trendspy if _ENGINE == "trendspy" else _fetch_rising_pytrends
+
+    if not fresh:
+        stale, age = _load_cache_any(_CACHE_RISING)
+        if stale and age is not None and age <= stale_age_hours:
+            print(f"[Rising Queries] Serving stale cache ({age:.0f}h old), refreshing in background")
+            _start_background_refresh(fetch, _CACHE_RISING, keywords_flat, "Rising Queries")
+            return stale
+
+    print(f"[Rising Queries] Using {_ENGINE} engine for {len(missing)}/{len(keywords_flat)} keywords")
+    results = fetch(missing)
+
+    if results or fresh:
+        merged = {**fresh, **(results or {})}
+        if len(merged) < len(keywords_flat):
+            merged = {**(_load_stale_cache(_CACHE_RISING) or {}), **merged}
+        _save_cache(_CACHE_RISING, merged, refreshed=set(results or {}))
+        print(f"[Rising Queries] Collected queries for {len(merged)} keywords.")
+        return merged
 
     stale = _load_stale_cache(_CACHE_RISING)
     if stale:
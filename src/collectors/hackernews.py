@@ -7,14 +7,16 @@ search API, targeting ergonomics and pain-related tech discussions.
 
 from __future__ import annotations
 
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import requests
 
+from ._http import get_session
 
-_HN_ALGOLIA_URL = "http://hn.algolia.com/api/v1/search_by_date"
+
+_HN_ALGOLIA_URL = "https://hn.algolia.com/api/v1/search_by_date"
 
 _DEFAULT_QUERIES = [
     "standing desk",
@@ -71,14 +73,10 @@ def collect_hacker_news_leads(
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
     cutoff_ts = int(cutoff.timestamp())
 
-    all_results: list[dict[str, str]] = []
-    seen_urls: set[str] = set()
-
-    for query_idx, query in enumerate(queries):
-        print(f"[Hacker News] Searching ({query_idx + 1}/{len(queries)}): '{query}'")
-
+    def _search(query: str) -> dict[str, Any] | None:
+        print(f"[Hacker News] Searching: '{query}'")
         try:
-            response = requests.get(
+            response = get_session("hn.algolia.com").get(
                 _HN_ALGOLIA_URL,
                 params={
                     "query": query,
@@ -90,13 +88,24 @@ def collect_hacker_news_leads(
                 timeout=15,
             )
             response.raise_for_status()
-            data = response.json()
-
+            return response.json()
         except requests.exceptions.RequestException as exc:
             print(f"[Hacker News] Request error for '{query}': {exc}")
-            continue
         except Exception as exc:
             print(f"[Hacker News] Unexpected error for '{query}': {exc}")
+        return None
+
+    # The queries are independent round-trips to the same API, so issue
+    # them concurrently; map() keeps responses in query order, which
+    # keeps deduplication and ranking deterministic.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        payloads = list(pool.map(_search, queries))
+
+    all_results: list[dict[str, str]] = []
+    seen_urls: set[str] = set()
+
+    for data in payloads:
+        if data is None:
             continue
 
         hits = data.get("hits", [])
@@ -127,10 +136,6 @@ def collect_hacker_news_leads(
                 "type": "TECH LEADER MATCH",
             })
 
-        # Small delay between API calls
-        if query_idx < len(queries) - 1:
-            time.sleep(0.5)
-
     if not all_results:
         print("[Hacker News] No results collected.")
         return None
@@ -7,11 +7,20 @@ Google News via RSS feed.
 
 from __future__ import annotations
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import quote
 
 import feedparser
 
+from ._http import get_session
+
+try:
+    from lxml import etree  # optional — much faster than feedparser for well-formed RSS
+except ImportError:
+    etree = None
+
 
 # Google News RSS base URL
 _GOOGLE_NEWS_RSS = "https://news.google.com/rss/search"
@@ -31,6 +40,85 @@ _SUPPLEMENTAL_QUERIES = [
 ]
 
 
+# Google News titles usually end with " - Source Name"; the greedy
+# first group splits at the last separator, like rsplit did, but in a
+# single scan instead of a containment check plus a split
+_TITLE_SPLIT_RE = re.compile(r"^(.*) - (.*)$")
+
+
+def _split_title(title: str) -> tuple[str, str]:
+    """Split a feed title into (headline, source); source is "Unknown"
+    when the separator is absent."""
+    match = _TITLE_SPLIT_RE.match(title)
+    if match:
+        return match.group(1).strip(), match.group(2).strip()
+    return title, "Unknown"
+
+
+def _feed_url(query: str) -> str:
+    return f"{_GOOGLE_NEWS_RSS}?q={quote(query)}&hl=en-US&gl=US&ceid=US:en"
+
+
+# The standard queries never change, so their encoded URLs are built
+# once at import instead of re-quoting on every call
+_DEFAULT_FEED_URL = _feed_url(_DEFAULT_QUERY)
+_SUPPLEMENTAL_FEED_URLS = [_feed_url(q) for q in _SUPPLEMENTAL_QUERIES]
+
+
+def _fetch_entries(feed_url: str) -> list[dict[str, str]] | None:
+    """Download and parse a feed into entry dicts.
+
+    Google News RSS is well-formed XML, so when lxml is installed the
+    items are extracted with its much faster parser; feedparser stays
+    on as the tolerant fallback for malformed payloads (and as the
+    whole path when lxml is missing).
+    """
+    try:
+        resp = get_session("news.google.com").get(feed_url, timeout=15)
+        resp.raise_for_status()
+        payload = resp.content
+    except Exception as exc:
+        print(f"[News] Failed to fetch RSS feed: {exc}")
+        return None
+
+    if etree is not None:
+        try:
+            root = etree.fromstring(payload)
+            return [
+                {
+                    "title": item.findtext("title") or "",
+                    "link": item.findtext("link") or "",
+                    "published": item.findtext("pubDate") or "",
+                    "source": item.findtext("source") or "",
+                }
+                for item in root.iterfind(".//item")
+            ]
+        except etree.XMLSyntaxError:
+            pass  # malformed payload — let feedparser have a go
+
+    parsed = feedparser.parse(payload)
+    if parsed.bozo and not parsed.entries:
+        print(f"[News] Feed error: {parsed.bozo_exception}")
+        return None
+
+    entries: list[dict[str, str]] = []
+    for entry in parsed.entries:
+        source_info = entry.get("source", {})
+        if hasattr(source_info, "get"):
+            source = source_info.get("title", "")
+        elif isinstance(source_info, str):
+            source = source_info
+        else:
+            source = ""
+        entries.append({
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "published": entry.get("published", entry.get("updated", "")),
+            "source": source,
+        })
+    return entries
+
+
 def collect_rss_news(
     query: str = _DEFAULT_QUERY,
     max_results: int = 10,
@@ -61,93 +149,67 @@ def collect_rss_news(
 
         Returns None if the collection fails or no articles are found.
     """
-    encoded_query = quote(query)
-    feed_url = f"{_GOOGLE_NEWS_RSS}?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
+    feed_url = _DEFAULT_FEED_URL if query == _DEFAULT_QUERY else _feed_url(query)
 
     print(f"[News] Fetching Google News RSS feed...")
 
-    try:
-        feed = feedparser.parse(feed_url)
-    except Exception as exc:
-        print(f"[News] Failed to parse RSS feed: {exc}")
-        return None
-
-    # Check for feed errors
-    if feed.bozo and not feed.entries:
-        print(f"[News] Feed error: {feed.bozo_exception}")
+    entries = _fetch_entries(feed_url)
+    if entries is None:
         return None
 
-    if not feed.entries:
+    if not entries:
         print("[News] No entries found in RSS feed.")
         return None
 
     articles: list[dict[str, Any]] = []
 
-    for entry in feed.entries[:max_results]:
-        try:
-            title = entry.get("title", "No title")
-
-            # Google News titles often include " - Source Name" at the end
-            source = "Unknown"
-            if " - " in title:
-                parts = title.rsplit(" - ", 1)
-                if len(parts) == 2:
-                    title = parts[0].strip()
-                    source = parts[1].strip()
-
-            # Also check the source field directly
-            if source == "Unknown":
-                source_info = entry.get("source", {})
-                if hasattr(source_info, "get"):
-                    source = source_info.get("title", source)
-                elif isinstance(source_info, str):
-                    source = source_info
-
-            url = entry.get("link", "")
-            date = entry.get("published", entry.get("updated", "Unknown"))
-
-            articles.append({
-                "title": title,
-                "source": source,
-                "url": url,
-                "date": date,
-            })
-
-        except Exception as exc:
-            print(f"[News] Error parsing entry: {exc}")
-            continue
-
-    # Supplemental queries for broader Bart-relevant coverage
+    for entry in entries[:max_results]:
+        title, source = _split_title(entry["title"] or "No title")
+
+        # Also check the source field directly
+        if source == "Unknown" and entry["source"]:
+            source = entry["source"]
+
+        articles.append({
+            "title": title,
+            "source": source,
+            "url": entry["link"],
+            "date": entry["published"] or "Unknown",
+        })
+
+    # Supplemental queries for broader Bart-relevant coverage. The
+    # feeds are independent, so fetch them concurrently and keep the
+    # merge loop in query order so the output stays deterministic.
+    # Each feed contributes at most 3 articles, so only enough feeds
+    # to cover the shortfall are requested.
     if include_supplemental and len(articles) < max_results:
         seen_titles = {a["title"].lower() for a in articles}
-        for sup_query in _SUPPLEMENTAL_QUERIES:
+
+        shortfall = max_results - len(articles)
+        feeds_needed = -(-shortfall // 3)  # ceil division
+        urls_to_fetch = _SUPPLEMENTAL_FEED_URLS[:feeds_needed]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sup_feeds = list(pool.map(_fetch_entries, urls_to_fetch))
+
+        for sup_entries in sup_feeds:
             if len(articles) >= max_results:
                 break
-            sup_encoded = quote(sup_query)
-            sup_url = f"{_GOOGLE_NEWS_RSS}?q={sup_encoded}&hl=en-US&gl=US&ceid=US:en"
-            try:
-                sup_feed = feedparser.parse(sup_url)
-                for entry in (sup_feed.entries or [])[:3]:
-                    if len(articles) >= max_results:
-                        break
-                    title = entry.get("title", "No title")
-                    source = "Unknown"
-                    if " - " in title:
-                        parts = title.rsplit(" - ", 1)
-                        if len(parts) == 2:
-                            title = parts[0].strip()
-                            source = parts[1].strip()
-                    if title.lower() in seen_titles:
-                        continue
-                    seen_titles.add(title.lower())
-                    articles.append({
-                        "title": title,
-                        "source": source,
-                        "url": entry.get("link", ""),
-                        "date": entry.get("published", "Unknown"),
-                    })
-            except Exception:
+            if not sup_entries:
                 continue
+            for entry in sup_entries[:3]:
+                if len(articles) >= max_results:
+                    break
+                title, source = _split_title(entry["title"] or "No title")
+                if title.lower() in seen_titles:
+                    continue
+                seen_titles.add(title.lower())
+                articles.append({
+                    "title": title,
+                    "source": source,
+                    "url": entry["link"],
+                    "date": entry["published"] or "Unknown",
+                })
 
     if not articles:
         print("[News] Failed to parse any articles from feed.")
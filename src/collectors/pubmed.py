@@ -1,15 +1,30 @@
 """
 PubMed research article collector for Trend Engine V2.0.
 
-Retrieves recent research articles from PubMed using the NCBI Entrez
-API via the biopython library.
+Retrieves recent research articles from PubMed by calling the NCBI
+E-utilities endpoints directly over pooled HTTP.
 """
 
 from __future__ import annotations
 
+import io
+import json
 from typing import Any
 
-from Bio import Entrez
+from ._http import cached_get
+
+try:
+    from lxml import etree  # optional — faster; the stdlib parser is the fallback
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+
+_EUTILS_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+_EUTILS_HOST = "eutils.ncbi.nlm.nih.gov"
+
+# Published research doesn't churn day to day, so responses stay
+# cacheable far longer than the social feeds
+_CACHE_TTL_S = 24 * 3600.0
 
 
 # Default query targeting pain and exercise/rehabilitation research
@@ -22,6 +37,76 @@ _DEFAULT_QUERY = (
 )
 
 
+class _EncodedStream:
+    """File-like adapter yielding bytes from a text- or binary-mode handle."""
+
+    def __init__(self, handle: Any) -> None:
+        self._handle = handle
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._handle.read(size)
+        return chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _text(elem, path: str, default: str = "") -> str:
+    node = elem.find(path)
+    if node is None:
+        return default
+    return "".join(node.itertext()).strip() or default
+
+
+def _parse_article(elem) -> dict[str, Any]:
+    """Extract one article dict from a ``PubmedArticle`` element."""
+    title = _text(elem, ".//ArticleTitle", "No title")
+    journal = _text(elem, ".//Journal/Title", "Unknown journal")
+
+    # Date — try ArticleDate first, then PubDate
+    date_elem = elem.find(".//ArticleDate")
+    if date_elem is not None:
+        year = _text(date_elem, "Year")
+        month = _text(date_elem, "Month").zfill(2)
+        day = _text(date_elem, "Day").zfill(2)
+        date_str = f"{year}-{month}-{day}"
+    else:
+        pub_date = elem.find(".//JournalIssue/PubDate")
+        parts = []
+        if pub_date is not None:
+            parts = [
+                p for p in (
+                    _text(pub_date, "Year"),
+                    _text(pub_date, "Month"),
+                    _text(pub_date, "Day"),
+                ) if p
+            ]
+        date_str = "-".join(parts) if parts else "Unknown"
+
+    return {
+        "title": title,
+        "journal": journal,
+        "date": date_str,
+        "pmid": _text(elem, ".//MedlineCitation/PMID"),
+    }
+
+
+def _parse_fetch_stream(handle: Any) -> list[dict[str, Any]]:
+    """Stream-parse an efetch XML response into article dicts.
+
+    iterparse visits one ``PubmedArticle`` at a time and clears it once
+    extracted, so peak memory stays at a single record instead of the
+    whole response DOM in memory.
+    """
+    articles: list[dict[str, Any]] = []
+    for _event, elem in etree.iterparse(_EncodedStream(handle), events=("end",)):
+        if elem.tag != "PubmedArticle":
+            continue
+        try:
+            articles.append(_parse_article(elem))
+        except Exception as exc:
+            print(f"[PubMed] Error parsing article record: {exc}")
+        elem.clear()
+    return articles
+
+
 def collect_pubmed(
     sender_email: str = "",
     query: str = _DEFAULT_QUERY,
@@ -29,7 +114,7 @@ def collect_pubmed(
 ) -> list[dict[str, Any]] | None:
     """Collect recent PubMed articles matching the pain/exercise query.
 
-    Uses NCBI Entrez to search PubMed for recently published articles
+    Uses the NCBI E-utilities API to search PubMed for recently published articles
     about chronic pain conditions and exercise/rehabilitation treatments.
 
     Args:
@@ -53,94 +138,61 @@ def collect_pubmed(
 
         Returns None if the collection fails.
     """
-    if sender_email:
-        Entrez.email = sender_email
-    else:
-        Entrez.email = "formcoach-trend-engine@example.com"
+    email = sender_email or "formcoach-trend-engine@example.com"
 
     print(f"[PubMed] Searching with retmax={retmax}...")
 
     # Step 1: Search for matching article IDs
     try:
-        search_handle = Entrez.esearch(
-            db="pubmed",
-            term=query,
-            sort="date",
-            retmax=retmax,
+        status, body = cached_get(
+            _EUTILS_HOST,
+            f"{_EUTILS_BASE}/esearch.fcgi",
+            params={
+                "db": "pubmed",
+                "term": query,
+                "sort": "date",
+                "retmax": retmax,
+                "retmode": "json",
+                "email": email,
+            },
+            timeout=15,
+            ttl=_CACHE_TTL_S,
         )
-        search_results = Entrez.read(search_handle)
-        search_handle.close()
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+        id_list = json.loads(body).get("esearchresult", {}).get("idlist", [])
     except Exception as exc:
         print(f"[PubMed] Search failed: {exc}")
         return None
 
-    id_list = search_results.get("IdList", [])
     if not id_list:
         print("[PubMed] No articles found matching query.")
         return None
 
     print(f"[PubMed] Found {len(id_list)} article IDs. Fetching details...")
 
-    # Step 2: Fetch article details
+    # Step 2: Fetch article details, parsed record by record
     try:
-        fetch_handle = Entrez.efetch(
-            db="pubmed",
-            id=id_list,
-            rettype="xml",
-            retmode="xml",
+        status, body = cached_get(
+            _EUTILS_HOST,
+            f"{_EUTILS_BASE}/efetch.fcgi",
+            params={
+                "db": "pubmed",
+                "id": ",".join(id_list),
+                "rettype": "xml",
+                "retmode": "xml",
+                "email": email,
+            },
+            timeout=30,
+            ttl=_CACHE_TTL_S,
         )
-        records = Entrez.read(fetch_handle)
-        fetch_handle.close()
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+        articles = _parse_fetch_stream(io.BytesIO(body))
     except Exception as exc:
         print(f"[PubMed] Fetch failed: {exc}")
         return None
 
-    articles: list[dict[str, Any]] = []
-
-    pubmed_articles = records.get("PubmedArticle", [])
-    for record in pubmed_articles:
-        try:
-            medline = record.get("MedlineCitation", {})
-            article_data = medline.get("Article", {})
-
-            # Title
-            title = str(article_data.get("ArticleTitle", "No title"))
-
-            # Journal
-            journal_info = article_data.get("Journal", {})
-            journal = str(journal_info.get("Title", "Unknown journal"))
-
-            # Date — try ArticleDate first, then PubDate
-            date_str = ""
-            article_dates = article_data.get("ArticleDate", [])
-            if article_dates:
-                date_obj = article_dates[0]
-                year = str(date_obj.get("Year", ""))
-                month = str(date_obj.get("Month", "")).zfill(2)
-                day = str(date_obj.get("Day", "")).zfill(2)
-                date_str = f"{year}-{month}-{day}"
-            else:
-                pub_date = journal_info.get("JournalIssue", {}).get("PubDate", {})
-                year = str(pub_date.get("Year", ""))
-                month = str(pub_date.get("Month", ""))
-                day = str(pub_date.get("Day", ""))
-                parts = [p for p in [year, month, day] if p]
-                date_str = "-".join(parts) if parts else "Unknown"
-
-            # PMID
-            pmid = str(medline.get("PMID", ""))
-
-            articles.append({
-                "title": title,
-                "journal": journal,
-                "date": date_str,
-                "pmid": pmid,
-            })
-
-        except Exception as exc:
-            print(f"[PubMed] Error parsing article record: {exc}")
-            continue
-
     if not articles:
         print("[PubMed] Failed to parse any articles.")
         return None
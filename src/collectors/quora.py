@@ -9,15 +9,25 @@ from __future__ import annotations
 
 import random
 import re
+import string
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import unquote
 
 import requests
 
+from ._http import cached_get
+
 
 _GOOGLE_SEARCH_URL = "https://www.google.com/search"
 
+# Search results for evergreen pain/fitness questions shift slowly, so
+# re-runs within the window skip Google entirely — the riskiest source
+# to hammer during development
+_CACHE_TTL_S = 6 * 3600.0
+
 _HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -29,6 +39,33 @@ _HEADERS = {
 }
 
 
+class _SlugTable(dict):
+    """Translate table mapping every non-slug codepoint to a space."""
+
+    def __missing__(self, codepoint: int) -> int:
+        return 0x20
+
+
+# Lowercase pass-through for slug characters; everything else becomes a
+# separator, collapsed by the split/join in _make_fingerprint
+_SLUG_TABLE = _SlugTable()
+for _c in string.ascii_lowercase + string.digits:
+    _SLUG_TABLE[ord(_c)] = ord(_c)
+for _c in string.ascii_uppercase:
+    _SLUG_TABLE[ord(_c)] = ord(_c.lower())
+
+# Non-question pages (profiles, topics, spaces, answer permalinks) in a
+# single alternation instead of four substring scans per URL
+_SKIP_RE = re.compile(r"/(?:profile|topic|space|answer)/")
+
+# Pattern to find Quora URLs in Google results
+# Google wraps URLs in /url?q= redirects or directly in href attributes
+_QUORA_URL_RE = re.compile(
+    r'href="(?:/url\?q=)?(https?://(?:www\.)?quora\.com/[^"&]+)',
+    re.IGNORECASE,
+)
+
+
 def _make_fingerprint(question: str) -> str:
     """Create a lowercase URL-style slug from a question string.
 
@@ -40,13 +77,15 @@ def _make_fingerprint(question: str) -> str:
         Example: "Best exercises for chronic back pain" becomes
         "best-exercises-for-chronic-back-pain".
     """
-    # Remove non-alphanumeric characters except spaces and hyphens
-    cleaned = re.sub(r"[^a-zA-Z0-9\s-]", "", question)
-    # Replace whitespace with hyphens and lowercase
-    slug = re.sub(r"\s+", "-", cleaned.strip()).lower()
-    # Collapse multiple hyphens
-    slug = re.sub(r"-+", "-", slug)
-    return slug
+    # One C-level translate pass (lowercase + separator mapping), then
+    # split/join collapses separator runs and trims the ends
+    return "-".join(question.translate(_SLUG_TABLE).split())
+
+
+def _looks_blocked(html: str) -> bool:
+    """Return True when a 200 response is really a CAPTCHA interstitial."""
+    lowered = html.lower()
+    return "unusual traffic" in lowered or "captcha" in lowered
 
 
 def _extract_quora_urls(html: str) -> list[dict[str, str]]:
@@ -60,18 +99,11 @@ def _extract_quora_urls(html: str) -> list[dict[str, str]]:
     """
     results: list[dict[str, str]] = []
 
-    # Pattern to find Quora URLs in Google results
-    # Google wraps URLs in /url?q= redirects or directly in href attributes
-    url_pattern = re.compile(
-        r'href="(?:/url\?q=)?(https?://(?:www\.)?quora\.com/[^"&]+)',
-        re.IGNORECASE,
-    )
-
-    for match in url_pattern.finditer(html):
+    for match in _QUORA_URL_RE.finditer(html):
         raw_url = unquote(match.group(1))
 
         # Skip non-question pages (profiles, topics, spaces, etc.)
-        if any(skip in raw_url for skip in ["/profile/", "/topic/", "/space/", "/answer/"]):
+        if _SKIP_RE.search(raw_url):
             continue
 
         # Extract question from URL path
@@ -124,69 +156,94 @@ def collect_quora(
 
     all_results: list[dict[str, Any]] = []
     seen_urls: set[str] = set()
-    blocked = False
-
-    session = requests.Session()
-    session.headers.update(_HEADERS)
-
-    for query_idx, query in enumerate(queries):
+    blocked = threading.Event()
+
+    # Google's blocking is rate-based, so the workers share one pacer
+    # granting a request every 3-5 jittered seconds — the politeness
+    # envelope is unchanged, but the queries overlap their network wait
+    pacer_lock = threading.Lock()
+    next_allowed = 0.0
+
+    def _pace() -> None:
+        nonlocal next_allowed
+        with pacer_lock:
+            now = time.monotonic()
+            wait = next_allowed - now
+            next_allowed = max(now, next_allowed) + random.uniform(3.0, 5.0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _search(query: str) -> list[dict[str, str]] | None:
+        """Run one Google search; None when skipped, blocked, or failed."""
+        if blocked.is_set():
+            return None
         search_query = f'site:quora.com "{query}"'
-        print(f"[Quora] Searching ({query_idx + 1}/{len(queries)}): {search_query}")
+        print(f"[Quora] Searching: {search_query}")
 
         try:
-            response = session.get(
+            status, body = cached_get(
+                "www.google.com",
                 _GOOGLE_SEARCH_URL,
                 params={"q": search_query, "num": max_per_query + 2},
+                headers=_HEADERS,
                 timeout=15,
+                ttl=_CACHE_TTL_S,
+                pace=_pace,
+                validate=lambda body: not _looks_blocked(
+                    body.decode("utf-8", "replace")),
             )
 
             # Check for Google blocking
-            if response.status_code == 429 or response.status_code == 503:
+            if status == 429 or status == 503:
                 print("[Quora] WARNING: Google is rate-limiting requests. Stopping.")
-                blocked = True
-                break
+                blocked.set()
+                return None
 
-            if response.status_code != 200:
-                print(f"[Quora] Got status {response.status_code} for query: {query}")
-                continue
+            if status != 200:
+                print(f"[Quora] Got status {status} for query: {query}")
+                return None
 
             # Check for CAPTCHA page
-            if "unusual traffic" in response.text.lower() or "captcha" in response.text.lower():
+            text = body.decode("utf-8", "replace")
+            if _looks_blocked(text):
                 print("[Quora] WARNING: Google CAPTCHA detected. Stopping.")
-                blocked = True
-                break
-
-            extracted = _extract_quora_urls(response.text)
-            count = 0
+                blocked.set()
+                return None
 
-            for item in extracted:
-                if count >= max_per_query:
-                    break
-                if item["url"] in seen_urls:
-                    continue
-
-                seen_urls.add(item["url"])
-                all_results.append({
-                    "question": item["question"],
-                    "url": item["url"],
-                    "source_query": query,
-                    "fingerprint": _make_fingerprint(item["question"]),
-                })
-                count += 1
+            return _extract_quora_urls(text)
 
         except requests.exceptions.RequestException as exc:
             print(f"[Quora] Request error for query '{query}': {exc}")
-            continue
+            return None
         except Exception as exc:
             print(f"[Quora] Unexpected error for query '{query}': {exc}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        extracted_lists = list(pool.map(_search, queries))
+
+    # Merge in query order so the dedup keeps the same winners as the
+    # old sequential loop
+    for query, extracted in zip(queries, extracted_lists):
+        if not extracted:
             continue
+        count = 0
+        for item in extracted:
+            if count >= max_per_query:
+                break
+            if item["url"] in seen_urls:
+                continue
 
-        # Sleep 3-5 seconds between searches to be polite
-        if query_idx < len(queries) - 1:
-            sleep_time = random.uniform(3.0, 5.0)
-            time.sleep(sleep_time)
+            seen_urls.add(item["url"])
+            all_results.append({
+                "question": item["question"],
+                "url": item["url"],
+                "source_query": query,
+                "fingerprint": _make_fingerprint(item["question"]),
+            })
+            count += 1
 
-    if blocked and not all_results:
+    if blocked.is_set() and not all_results:
         print("[Quora] WARNING: Google blocked all requests. Returning None.")
         return None
 
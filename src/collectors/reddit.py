@@ -7,6 +7,7 @@ local leads from Bay Area and executive subreddits.
 
 from __future__ import annotations
 
+import itertools
 from typing import Any
 
 import praw
@@ -59,39 +60,59 @@ def collect_reddit(
 
     results: dict[str, dict[str, list[dict[str, Any]]]] = {}
 
-    # Flatten all subreddit names from the category dict
-    all_subreddits: list[str] = []
-    for sub_list in subreddits.values():
-        all_subreddits.extend(sub_list)
-
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    unique_subreddits: list[str] = []
-    for sub in all_subreddits:
-        if sub not in seen:
-            seen.add(sub)
-            unique_subreddits.append(sub)
-
-    for sub_name in unique_subreddits:
+    # Flatten the category dict and dedup in one pass; dict keys are
+    # insertion-ordered, so first occurrence wins as before
+    unique_subreddits = list(dict.fromkeys(
+        itertools.chain.from_iterable(subreddits.values())))
+
+    def _post_dict(submission, sub_name: str) -> dict[str, Any]:
+        return {
+            "title": submission.title,
+            "score": submission.score,
+            "comments": submission.num_comments,
+            "url": f"https://reddit.com{submission.permalink}",
+            "subreddit": sub_name,
+            # Pre-created so the relevance filter overwrites in
+            # place instead of growing every post dict
+            "relevance_score": 0.0,
+        }
+
+    def _fetch_single(sub_name: str) -> None:
         print(f"[Reddit] Fetching top posts from r/{sub_name}...")
         try:
             subreddit = reddit.subreddit(sub_name)
-            posts: list[dict[str, Any]] = []
-
-            for submission in subreddit.top(time_filter="week", limit=10):
-                posts.append({
-                    "title": submission.title,
-                    "score": submission.score,
-                    "comments": submission.num_comments,
-                    "url": f"https://reddit.com{submission.permalink}",
-                    "subreddit": sub_name,
-                })
-
-            results[sub_name] = posts
-
+            results[sub_name] = [
+                _post_dict(submission, sub_name)
+                for submission in subreddit.top(time_filter="week", limit=10)
+            ]
         except Exception as exc:
             print(f"[Reddit] Error fetching r/{sub_name}: {exc}")
-            continue
+
+    # The combined "a+b+c" listing pulls top posts for a whole chunk of
+    # subreddits in one round-trip instead of one request per sub. The
+    # shared listing favours higher-scoring subs, so quiet subs may get
+    # fewer than 10 posts; the per-sub loop remains the fallback when a
+    # chunk fails (e.g. one banned sub poisons the combined name).
+    chunk_size = 40
+    for start in range(0, len(unique_subreddits), chunk_size):
+        chunk = unique_subreddits[start : start + chunk_size]
+        print(f"[Reddit] Fetching top posts from {len(chunk)} subreddits (combined)...")
+        try:
+            combined = reddit.subreddit("+".join(chunk))
+            buckets: dict[str, list[dict[str, Any]]] = {sub: [] for sub in chunk}
+            # submission.subreddit reports canonical capitalization,
+            # which may differ from the configured name
+            by_lower = {sub.lower(): sub for sub in chunk}
+            for submission in combined.top(time_filter="week", limit=10 * len(chunk)):
+                sub_name = by_lower.get(str(submission.subreddit).lower())
+                if sub_name is None or len(buckets[sub_name]) >= 10:
+                    continue
+                buckets[sub_name].append(_post_dict(submission, sub_name))
+            results.update(buckets)
+        except Exception as exc:
+            print(f"[Reddit] Combined fetch failed ({exc}); retrying per subreddit")
+            for sub_name in chunk:
+                _fetch_single(sub_name)
 
     if not results:
         print("[Reddit] No results collected.")
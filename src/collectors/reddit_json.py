@@ -11,11 +11,17 @@ between subreddit fetches to stay well within limits.
 
 from __future__ import annotations
 
+import itertools
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
 
+from ._http import cached_get
+
 _USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
@@ -33,6 +39,29 @@ def _get_headers() -> dict[str, str]:
 
 _REQUEST_DELAY = 6  # seconds between requests to respect rate limits
 
+# Weekly-top listings barely move within an hour, so re-runs inside
+# that window (development, a crash partway through a collection) are
+# served from disk instead of re-spending rate-limit budget
+_CACHE_TTL_S = 3600.0
+
+# Reddit's unauthenticated limit is global per IP, not per subreddit, so
+# concurrent workers share one pacer: each request claims the next slot
+# under the lock and sleeps outside it. Fetches overlap their network
+# wait while the request *rate* stays at ~10/minute.
+_PACER_LOCK = threading.Lock()
+_next_allowed = 0.0
+
+
+def _pace() -> None:
+    """Block until this thread's request slot comes up."""
+    global _next_allowed
+    with _PACER_LOCK:
+        now = time.monotonic()
+        wait = _next_allowed - now
+        _next_allowed = max(now, _next_allowed) + _REQUEST_DELAY
+    if wait > 0:
+        time.sleep(wait)
+
 
 def _fetch_subreddit_top(
     sub_name: str,
@@ -48,25 +77,31 @@ def _fetch_subreddit_top(
 
     try:
         headers = _get_headers()
-        resp = requests.get(url, headers=headers, params=params, timeout=15)
-        if resp.status_code == 429:
+        status, body = cached_get(
+            "www.reddit.com", url, params=params, headers=headers,
+            timeout=15, ttl=_CACHE_TTL_S, pace=_pace)
+        if status == 429:
             print(f"[Reddit-JSON] Rate limited on r/{sub_name}, waiting 30s...")
             time.sleep(30)
-            resp = requests.get(url, headers=headers, params=params, timeout=15)
+            status, body = cached_get(
+                "www.reddit.com", url, params=params, headers=headers,
+                timeout=15, ttl=_CACHE_TTL_S, pace=_pace)
 
-        if resp.status_code == 403:
+        if status == 403:
             # Try old.reddit.com as fallback
             old_url = f"https://old.reddit.com/r/{sub_name}/top.json"
-            resp = requests.get(old_url, headers=headers, params=params, timeout=15)
-            if resp.status_code != 200:
+            status, body = cached_get(
+                "old.reddit.com", old_url, params=params, headers=headers,
+                timeout=15, ttl=_CACHE_TTL_S, pace=_pace)
+            if status != 200:
                 print(f"[Reddit-JSON] r/{sub_name} returned HTTP 403 (both endpoints)")
                 return []
 
-        elif resp.status_code != 200:
-            print(f"[Reddit-JSON] r/{sub_name} returned HTTP {resp.status_code}")
+        elif status != 200:
+            print(f"[Reddit-JSON] r/{sub_name} returned HTTP {status}")
             return []
 
-        data = resp.json()
+        data = json.loads(body)
         children = data.get("data", {}).get("children", [])
 
         posts: list[dict[str, Any]] = []
@@ -79,6 +114,9 @@ def _fetch_subreddit_top(
                 "url": f"https://reddit.com{post.get('permalink', '')}",
                 "subreddit": sub_name,
                 "body": (post.get("selftext", "") or "")[:300],
+                # Pre-created so the relevance filter overwrites in
+                # place instead of growing every post dict
+                "relevance_score": 0.0,
             })
 
         return posts
@@ -107,14 +145,18 @@ def _search_subreddit(
 
     try:
         headers = _get_headers()
-        resp = requests.get(url, headers=headers, params=params, timeout=15)
-        if resp.status_code in (403, 429):
+        status, body = cached_get(
+            "www.reddit.com", url, params=params, headers=headers,
+            timeout=15, ttl=_CACHE_TTL_S, pace=_pace)
+        if status in (403, 429):
             old_url = f"https://old.reddit.com/r/{sub_name}/search.json"
-            resp = requests.get(old_url, headers=headers, params=params, timeout=15)
-        if resp.status_code != 200:
+            status, body = cached_get(
+                "old.reddit.com", old_url, params=params, headers=headers,
+                timeout=15, ttl=_CACHE_TTL_S, pace=_pace)
+        if status != 200:
             return []
 
-        data = resp.json()
+        data = json.loads(body)
         children = data.get("data", {}).get("children", [])
 
         posts: list[dict[str, Any]] = []
@@ -146,27 +188,22 @@ def collect_reddit_json(
     Returns:
         A dict mapping each subreddit name to its top posts, or None on failure.
     """
-    # Deduplicate subreddits
-    seen: set[str] = set()
-    unique: list[str] = []
-    for sub_list in subreddits.values():
-        for sub in sub_list:
-            if sub not in seen:
-                seen.add(sub)
-                unique.append(sub)
+    # Deduplicate subreddits (dict keys keep first-occurrence order)
+    unique = list(dict.fromkeys(
+        itertools.chain.from_iterable(subreddits.values())))
 
     results: dict[str, list[dict[str, Any]]] = {}
 
-    for i, sub_name in enumerate(unique):
-        print(f"[Reddit-JSON] Fetching top posts from r/{sub_name}... ({i+1}/{len(unique)})")
-        posts = _fetch_subreddit_top(sub_name)
+    # The pacer keeps the global request rate polite, so the workers
+    # only overlap network latency; map() keeps results in sub order
+    print(f"[Reddit-JSON] Fetching top posts from {len(unique)} subreddits...")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        fetched = list(pool.map(_fetch_subreddit_top, unique))
+
+    for sub_name, posts in zip(unique, fetched):
         if posts:
             results[sub_name] = posts
 
-        # Rate limiting delay (skip after last request)
-        if i < len(unique) - 1:
-            time.sleep(_REQUEST_DELAY)
-
     if not results:
         print("[Reddit-JSON] No results collected.")
         return None
@@ -211,39 +248,36 @@ def collect_local_leads_json(
     leads: list[dict[str, str]] = []
     seen_urls: set[str] = set()
 
-    # Bay Area local leads
-    for sub_name in bay_area_subs[:3]:  # limit to avoid rate limiting
-        for keyword in pain_keywords[:3]:
-            posts = _search_subreddit(sub_name, keyword, limit=2)
-            for post in posts:
-                if post["url"] in seen_urls:
-                    continue
-                seen_urls.add(post["url"])
-                leads.append({
-                    "source": f"r/{sub_name}",
-                    "title": post["title"],
-                    "url": post["url"],
-                    "snippet": post.get("body", "")[:200],
-                    "type": "BAY AREA LOCAL LEAD",
-                })
-            time.sleep(_REQUEST_DELAY)
-
-    # Exec subreddit leads
-    for sub_name in exec_subreddits[:4]:
-        for keyword in (lifestyle_keywords + pain_keywords)[:3]:
-            posts = _search_subreddit(sub_name, keyword, limit=2)
-            for post in posts:
-                if post["url"] in seen_urls:
-                    continue
-                seen_urls.add(post["url"])
-                leads.append({
-                    "source": f"r/{sub_name}",
-                    "title": post["title"],
-                    "url": post["url"],
-                    "snippet": post.get("body", "")[:200],
-                    "type": "EXEC LIFESTYLE LEAD",
-                })
-            time.sleep(_REQUEST_DELAY)
+    # Every (sub, keyword) pair is an independent search, so dispatch
+    # them all to the pool; the pacer inside _search_subreddit keeps
+    # the global request rate polite, and consuming map() results in
+    # task order keeps the URL dedup deterministic without locks.
+    tasks: list[tuple[str, str, str]] = [
+        (sub_name, keyword, "BAY AREA LOCAL LEAD")
+        for sub_name in bay_area_subs[:3]  # limit to avoid rate limiting
+        for keyword in pain_keywords[:3]
+    ] + [
+        (sub_name, keyword, "EXEC LIFESTYLE LEAD")
+        for sub_name in exec_subreddits[:4]
+        for keyword in (lifestyle_keywords + pain_keywords)[:3]
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        batches = list(pool.map(
+            lambda task: _search_subreddit(task[0], task[1], limit=2), tasks))
+
+    for (sub_name, _keyword, lead_type), posts in zip(tasks, batches):
+        for post in posts:
+            if post["url"] in seen_urls:
+                continue
+            seen_urls.add(post["url"])
+            leads.append({
+                "source": f"r/{sub_name}",
+                "title": post["title"],
+                "url": post["url"],
+                "snippet": post.get("body", "")[:200],
+                "type": lead_type,
+            })
 
     if not leads:
         print("[Reddit-JSON] No leads found.")
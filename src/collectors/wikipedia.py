@@ -13,6 +13,8 @@ from typing import Any
 
 import requests
 
+from ._http import get_session
+
 
 _BASE_URL = (
     "https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article"
@@ -74,7 +76,7 @@ def collect_wikipedia_pageviews(
 
         print(f"[Wikipedia] Fetching pageviews for '{article_slug}'...")
         try:
-            response = requests.get(url, headers=_HEADERS, timeout=15)
+            response = get_session("wikimedia.org").get(url, headers=_HEADERS, timeout=15)
 
             if response.status_code == 404:
                 print(f"[Wikipedia] Article not found: '{article_slug}', skipping.")
@@ -5,12 +5,15 @@ Save/load/diff weekly data snapshots as JSON in data/.
 """
 
 import json
+import pickle
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 
+FINGERPRINT_CACHE_NAME = "prior_fingerprints.pkl"
+
 
 def ensure_data_dir():
     """Create data directory if it doesn't exist."""
@@ -64,6 +67,35 @@ def load_snapshot_by_date(date_str: str) -> Optional[dict]:
         return json.load(f)
 
 
+def save_fingerprint_cache(cache: dict) -> Path:
+    """
+    Persist pre-tokenized Reddit fingerprints next to the snapshot so
+    next week's emerging-signal diff can skip re-tokenizing every prior
+    title. Pickled (highest protocol) because the payload is frozensets.
+    """
+    ensure_data_dir()
+    path = DATA_DIR / FINGERPRINT_CACHE_NAME
+    with open(path, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def load_fingerprint_cache() -> Optional[dict]:
+    """
+    Load the pickled fingerprint cache for the prior snapshot.
+    Returns None if missing or unreadable (the diff then recomputes).
+    """
+    path = DATA_DIR / FINGERPRINT_CACHE_NAME
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (pickle.UnpicklingError, EOFError, IOError) as e:
+        print(f"  Warning: Could not load fingerprint cache: {e}")
+        return None
+
+
 def get_brief_number() -> int:
     """Return the next brief number based on existing snapshots."""
     ensure_data_dir()
@@ -77,8 +77,11 @@ from collectors.hackernews import collect_hacker_news_leads
 from collectors.youtube_competitors import collect_competitor_videos
 
 # ── Analysis ──
-from analysis.emerging import detect_emerging_signals, deduplicate_reddit_posts, detect_declining_signals
-from analysis.theme import build_analysis, select_theme
+from analysis.emerging import (
+    detect_emerging_signals, deduplicate_reddit_posts, detect_declining_signals,
+    build_prior_fingerprint_cache,
+)
+from analysis.theme import build_analysis
 from analysis.engagement import rank_engagement_opportunities
 from analysis.seasonal import get_seasonal_context
 from analysis.assessment import suggest_assessment
@@ -97,6 +100,7 @@ from rendering.sender import send_email
 # ── Persistence ──
 from persistence.snapshot import (
     load_latest_snapshot, save_snapshot, get_brief_number, save_html,
+    load_fingerprint_cache, save_fingerprint_cache,
 )
 
 
@@ -128,6 +132,7 @@ def main():
     # ────────────────────────────────────────────────────────
     logger.info("\n[1/9] Loading prior snapshot...")
     prior = load_latest_snapshot()
+    prior_fp_cache = load_fingerprint_cache()
     is_first_run = prior is None
     prior_theme = prior.get("theme") if prior else None
 
@@ -247,19 +252,19 @@ def main():
         "quora": quora,
         "wikipedia": wikipedia,
     }
-    emerging = detect_emerging_signals(current_data, prior)
+    emerging = detect_emerging_signals(current_data, prior, prior_fp_cache)
     logger.info(f"  {emerging.get('summary', 'No emerging signals')}")
 
     # ────────────────────────────────────────────────────────
     # 5. BUILD ANALYSIS & SELECT THEME
     # ────────────────────────────────────────────────────────
     logger.info("\n[5/9] Building analysis...")
-    theme = select_theme(google, wikipedia, reddit, prior_theme)
     analysis = build_analysis(
         google, rising, reddit, quora, wikipedia,
         pubmed, news, leads, hn_leads,
+        prior_theme=prior_theme,
     )
-    analysis["theme"] = theme
+    theme = analysis["theme"]
     logger.info(f"  Theme: '{theme}'")
     body_groups = analysis.get("body_part_groups", [])
     if body_groups:
@@ -375,6 +380,9 @@ def main():
         "strategy_source": strategy_source,
     }
     save_snapshot(snapshot_data)
+    save_fingerprint_cache(
+        build_prior_fingerprint_cache(reddit, snapshot_data["date"])
+    )
 
     if preview:
         logger.info("\n--- PREVIEW MODE --- (email not sent)")